@@ -13,7 +13,7 @@ Uses USAC Open Data API (Socrata):
   - Entities:    https://opendata.usac.org/resource/srbr-2d59.json
 """
 
-import requests
+import httpx
 import csv
 import json
 import time
@@ -22,6 +22,8 @@ import sys
 from datetime import datetime
 from typing import List, Dict, Optional, Set
 from collections import OrderedDict
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor
 
 
 # ============================================================================
@@ -46,18 +48,43 @@ RATE_LIMIT_DELAY = 0.2  # Seconds between requests
 MAX_RETRIES = 3         # Retry count on failure
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraped_data")
 
+# HTTP/2 lets concurrent phases multiplex over one connection; it needs the
+# optional `h2` package (pip install "httpx[http2]"), else HTTP/1.1 is used
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+
+def make_http_client() -> httpx.Client:
+    """
+    Build the thread-safe client shared by all phases of one run.
+    
+    Every page request reuses its pooled connections. Redirects are followed
+    to match the behavior of the requests library this replaced.
+    """
+    return httpx.Client(
+        http2=HTTP2_ENABLED,
+        headers=HEADERS,
+        timeout=120.0,
+        limits=httpx.Limits(max_connections=16),
+        follow_redirects=True,
+    )
+
 
 # ============================================================================
 # API Helper
 # ============================================================================
 
-def fetch_paginated(dataset_id: str, params_base: dict = None, 
+def fetch_paginated(client: httpx.Client, dataset_id: str, params_base: dict = None, 
                     batch_size: int = BATCH_SIZE, max_records: int = 0,
                     description: str = "") -> List[Dict]:
     """
     Fetch all records from a USAC Socrata dataset with pagination.
     
     Args:
+        client: HTTP client to issue the page requests with
         dataset_id: Socrata dataset identifier (e.g., 'x5px-esft')
         params_base: Base query parameters ($select, $where, $group, etc.)
         batch_size: Number of records per request
@@ -85,7 +112,7 @@ def fetch_paginated(dataset_id: str, params_base: dict = None,
         
         for attempt in range(MAX_RETRIES):
             try:
-                response = requests.get(url, params=params, headers=HEADERS, timeout=120)
+                response = client.get(url, params=params)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -101,7 +128,7 @@ def fetch_paginated(dataset_id: str, params_base: dict = None,
                     else:
                         print(f"  ✗ Failed after {MAX_RETRIES} attempts at offset {offset}")
                         return all_records
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 print(f"  ⚠ Timeout on attempt {attempt+1}. Retrying...")
                 time.sleep(3)
             except Exception as e:
@@ -138,7 +165,20 @@ def fetch_paginated(dataset_id: str, params_base: dict = None,
 # Consultant Scraper (CRN/ACRN)
 # ============================================================================
 
-def scrape_consultants() -> List[Dict]:
+def _consultant_crn(record: Dict) -> str:
+    """Normalized CRN for a consultant record ('' if missing)."""
+    return record.get("cnslt_epc_organization_id", "").strip()
+
+
+def _consultant_score(record: Dict) -> tuple:
+    """Ranking key for duplicate CRN rows: latest funding year, then application count."""
+    return (
+        int(record.get("latest_funding_year") or 0),
+        int(record.get("application_count") or 0),
+    )
+
+
+def scrape_consultants(client: httpx.Client) -> List[Dict]:
     """
     Scrape all unique E-Rate consultants from the USAC consultant dataset.
     Returns deduplicated list by CRN with the most recent info.
@@ -174,7 +214,7 @@ def scrape_consultants() -> List[Dict]:
     }
     
     raw_records = fetch_paginated(
-        DATASETS["consultants"], params, 
+        client, DATASETS["consultants"], params, 
         batch_size=5000,
         description="Unique Consultant Records (grouped)"
     )
@@ -187,7 +227,7 @@ def scrape_consultants() -> List[Dict]:
         "$where": "cnslt_epc_organization_id IS NOT NULL",
     }
     school_counts_raw = fetch_paginated(
-        DATASETS["consultants"], school_count_params,
+        client, DATASETS["consultants"], school_count_params,
         batch_size=5000,
         description="School counts per consultant"
     )
@@ -196,27 +236,16 @@ def scrape_consultants() -> List[Dict]:
         for r in school_counts_raw
     }
     
-    # Step 3: Deduplicate by CRN (keep the one with most applications / latest year)
+    # Step 3: Deduplicate by CRN (keep the one with latest year / most applications).
+    # Rows arrive ordered by CRN, so each CRN is one contiguous group.
     crn_map = {}
-    for record in raw_records:
-        crn = record.get("cnslt_epc_organization_id", "").strip()
+    for crn, group in groupby(raw_records, key=_consultant_crn):
         if not crn:
             continue
-        
+        best = max(group, key=_consultant_score)
+        # Guard against a CRN split across groups (e.g. stray whitespace)
         existing = crn_map.get(crn)
-        if existing is None:
-            crn_map[crn] = record
-        else:
-            # Keep the one with the latest funding year, or more applications
-            new_year = record.get("latest_funding_year", "0")
-            old_year = existing.get("latest_funding_year", "0")
-            if new_year > old_year:
-                crn_map[crn] = record
-            elif new_year == old_year:
-                new_count = int(record.get("application_count", 0))
-                old_count = int(existing.get("application_count", 0))
-                if new_count > old_count:
-                    crn_map[crn] = record
+        crn_map[crn] = best if existing is None else max(existing, best, key=_consultant_score)
     
     # Step 4: Build final consultant list
     consultants = []
@@ -242,7 +271,7 @@ def scrape_consultants() -> List[Dict]:
 # Vendor/Service Provider Scraper (SPIN)
 # ============================================================================
 
-def scrape_vendors() -> List[Dict]:
+def scrape_vendors(client: httpx.Client) -> List[Dict]:
     """
     Scrape all service providers (vendors) from the USAC vendor dataset.
     Each record is already unique per SPIN.
@@ -270,7 +299,7 @@ def scrape_vendors() -> List[Dict]:
     }
     
     raw_records = fetch_paginated(
-        DATASETS["vendors"], params,
+        client, DATASETS["vendors"], params,
         batch_size=5000,
         description="All Service Providers / Vendors"
     )
@@ -309,7 +338,7 @@ def scrape_vendors() -> List[Dict]:
 # Entity Scraper (BEN)
 # ============================================================================
 
-def scrape_entities() -> List[Dict]:
+def scrape_entities(client: httpx.Client) -> List[Dict]:
     """
     Scrape all unique billed entities from the USAC Form 471 dataset.
     Fetches raw records with minimal fields and deduplicates locally by BEN.
@@ -342,7 +371,7 @@ def scrape_entities() -> List[Dict]:
         }
         
         year_records = fetch_paginated(
-            DATASETS["entities"], params,
+            client, DATASETS["entities"], params,
             batch_size=10000,
             description=f"Entities for funding year {year}"
         )
@@ -354,42 +383,43 @@ def scrape_entities() -> List[Dict]:
             if not ben:
                 continue
             
+            # Contact-quality rank: prefer records with email, then name,
+            # then the newest funding year (compared as a single tuple)
+            new_year = record.get("funding_year", "0")
+            rank = (
+                bool(record.get("cnct_email", "").strip()),
+                bool(record.get("cnct_name", "").strip()),
+                new_year,
+            )
+            funding = float(record.get("funding_commitment_request", 0) or 0)
+            
             existing = ben_map.get(ben)
             if existing is None:
                 # First time seeing this BEN - initialize aggregation
                 ben_map[ben] = {
                     **record,
                     "_frn_count": 1,
-                    "_total_funding": float(record.get("funding_commitment_request", 0) or 0),
-                    "_latest_year": record.get("funding_year", "0"),
+                    "_total_funding": funding,
+                    "_latest_year": new_year,
+                    "_rank": rank,
                 }
-            else:
-                # Update: prefer records with contact info, latest year
-                existing["_frn_count"] += 1
-                existing["_total_funding"] += float(record.get("funding_commitment_request", 0) or 0)
-                
-                new_year = record.get("funding_year", "0")
-                if new_year > existing["_latest_year"]:
-                    existing["_latest_year"] = new_year
-                
-                # Upgrade record if this one has email and old one doesn't,
-                # or if same and this one is newer
-                new_has_email = bool(record.get("cnct_email", "").strip())
-                old_has_email = bool(existing.get("cnct_email", "").strip())
-                new_has_name = bool(record.get("cnct_name", "").strip())
-                old_has_name = bool(existing.get("cnct_name", "").strip())
-                
-                if (new_has_email and not old_has_email) or \
-                   (new_has_email == old_has_email and new_has_name and not old_has_name) or \
-                   (new_has_email == old_has_email and new_has_name == old_has_name and new_year > existing.get("funding_year", "0")):
-                    # Preserve aggregated fields
-                    frn_count = existing["_frn_count"]
-                    total_funding = existing["_total_funding"]
-                    latest_year = existing["_latest_year"]
-                    existing.update(record)
-                    existing["_frn_count"] = frn_count
-                    existing["_total_funding"] = total_funding
-                    existing["_latest_year"] = latest_year
+                continue
+            
+            # Update in place: `existing` is the dict stored in ben_map,
+            # so no re-assignment (and no second hash lookup) is needed
+            existing["_frn_count"] += 1
+            existing["_total_funding"] += funding
+            
+            if new_year > existing["_latest_year"]:
+                existing["_latest_year"] = new_year
+            
+            # The stored record's rank is cached, so its contact fields are
+            # never re-stripped on later merges
+            if rank > existing["_rank"]:
+                # Raw records never carry the "_" aggregate keys, so update()
+                # leaves _frn_count/_total_funding/_latest_year untouched
+                existing.update(record)
+                existing["_rank"] = rank
         
         print(f"    → Unique BENs so far: {len(ben_map):,}")
     
@@ -487,6 +517,26 @@ def print_summary(consultants, vendors, entities):
 # Main
 # ============================================================================
 
+PHASES = {
+    "consultants": (scrape_consultants, "usac_consultants.csv"),
+    "vendors": (scrape_vendors, "usac_vendors.csv"),
+    "entities": (scrape_entities, "usac_entities.csv"),
+}
+
+
+def run_phase(name: str, scrape_fn, filename: str, client: httpx.Client) -> List[Dict]:
+    """Run one scrape phase and export it; errors are logged, not raised."""
+    try:
+        records = scrape_fn(client)
+        export_to_csv(records, filename, name)
+        return records
+    except Exception as e:
+        print(f"\n  ✗ ERROR scraping {name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return []
+
+
 def main():
     """Main entry point - scrape all USAC data and export to CSV."""
     start_time = time.time()
@@ -500,39 +550,23 @@ def main():
     # Allow running individual phases via command-line args
     phases = sys.argv[1:] if len(sys.argv) > 1 else ["consultants", "vendors", "entities"]
     
-    consultants = []
-    vendors = []
-    entities = []
+    # The three phases hit independent datasets with independent rate
+    # limits, so run them concurrently; wall-clock becomes the slowest phase
+    results = {"consultants": [], "vendors": [], "entities": []}
+    # The executor exits first, so the client is closed only after all phases
+    with make_http_client() as client, \
+            ThreadPoolExecutor(max_workers=len(PHASES)) as executor:
+        futures = {
+            name: executor.submit(run_phase, name, scrape_fn, filename, client)
+            for name, (scrape_fn, filename) in PHASES.items()
+            if name in phases
+        }
+        for name, future in futures.items():
+            results[name] = future.result()
     
-    # Phase 1: Consultants
-    if "consultants" in phases:
-        try:
-            consultants = scrape_consultants()
-            export_to_csv(consultants, "usac_consultants.csv", "consultants")
-        except Exception as e:
-            print(f"\n  ✗ ERROR scraping consultants: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Phase 2: Vendors
-    if "vendors" in phases:
-        try:
-            vendors = scrape_vendors()
-            export_to_csv(vendors, "usac_vendors.csv", "vendors")
-        except Exception as e:
-            print(f"\n  ✗ ERROR scraping vendors: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Phase 3: Entities
-    if "entities" in phases:
-        try:
-            entities = scrape_entities()
-            export_to_csv(entities, "usac_entities.csv", "entities")
-        except Exception as e:
-            print(f"\n  ✗ ERROR scraping entities: {e}")
-            import traceback
-            traceback.print_exc()
+    consultants = results["consultants"]
+    vendors = results["vendors"]
+    entities = results["entities"]
     
     # Summary
     elapsed = time.time() - start_time
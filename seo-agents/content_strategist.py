@@ -11,19 +11,32 @@ This agent is delegated tasks by the SEO Orchestrator and specializes in:
 - TOFU/MOFU/BOFU content mapping
 """
 
+import asyncio
+import functools
+import json
+import sys
+import threading
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Callable, ClassVar, NamedTuple, Tuple
 from enum import Enum
+from collections import OrderedDict
 
+from keyword_trie import KeywordTrie
 
-class FunnelStage(Enum):
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+
+class FunnelStage(str, Enum):
     TOFU = "top_of_funnel"      # Awareness
     MOFU = "middle_of_funnel"   # Consideration
     BOFU = "bottom_of_funnel"   # Decision
 
 
-class ContentType(Enum):
+class ContentType(str, Enum):
     BLOG_POST = "blog_post"
     PILLAR_PAGE = "pillar_page"
     LANDING_PAGE = "landing_page"
@@ -32,7 +45,7 @@ class ContentType(Enum):
     GUIDE = "guide"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContentPiece:
     """Represents a planned content piece."""
     title: str
@@ -40,21 +53,715 @@ class ContentPiece:
     content_type: ContentType
     funnel_stage: FunnelStage
     primary_keyword: str
-    secondary_keywords: List[str]
+    secondary_keywords: Tuple[str, ...]
     word_count_target: int
-    internal_links_to: List[str]
-    internal_links_from: List[str]
+    internal_links_to: Tuple[str, ...] = ()
+    internal_links_from: Tuple[str, ...] = ()
     publish_date: Optional[str] = None
-    outline: Optional[List[str]] = None
+    outline: Optional[Tuple[str, ...]] = None
+    
+    @property
+    def inlink_count(self) -> int:
+        """Number of planned pages linking here (from the shared link graph)."""
+        graph = _link_graph()
+        idx = graph.index.get(self.url)
+        if idx is None:  # not part of the planned content graph
+            return 0
+        return graph.inlink_counts[idx]
+
+
+class LinkGraph(NamedTuple):
+    """
+    Internal-link graph in compressed sparse row (CSR) form.
+    
+    Outlinks of node i are indices[indptr[i]:indptr[i + 1]]; urls/index map
+    between node ids and page URLs.
+    """
+    urls: Tuple[str, ...]
+    index: Dict[str, int]
+    indptr: array
+    indices: array
+    inlink_counts: array
 
 
-@dataclass
+class CalendarEntry(NamedTuple):
+    """One scheduled piece from the content calendar, flattened out of its month."""
+    month: str
+    week: Optional[int]
+    priority: Optional[str]
+    type: str
+    url: str
+    title: str
+
+
+@dataclass(slots=True, frozen=True)
 class TopicCluster:
     """Represents a topic cluster with pillar and cluster content."""
     name: str
     pillar_page: ContentPiece
-    cluster_pages: List[ContentPiece]
-    related_keywords: List[str]
+    cluster_pages: Tuple[ContentPiece, ...] = ()
+    related_keywords: Tuple[str, ...] = ()
+    _n_pages: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so cluster_pages never changes after construction.
+        object.__setattr__(self, "_n_pages", len(self.cluster_pages))
+    
+    def to_summary(self) -> Dict[str, Any]:
+        """JSON-ready summary used in create_topic_clusters responses."""
+        return {
+            "name": self.name,
+            "pillar": self.pillar_page.url,
+            "cluster_pages": [p.url for p in self.cluster_pages],
+            "keywords": list(self.related_keywords)
+        }
+
+
+# =========================================================================
+# STATIC CONTENT PLAN
+# =========================================================================
+# Each payload is built lazily on first use and cached for the process.
+# Handlers return them by reference instead of rebuilding the literals per
+# call, so treat returned payloads as read-only.
+
+# Canonical page URLs. Interned so every cluster/link reference to the same
+# page shares one string object and compares by identity first.
+URL_HOME = sys.intern("/")
+URL_APPLICATION_HELP = sys.intern("/e-rate-application-help")
+URL_FORM_470 = sys.intern("/form-470")
+URL_FORM_471 = sys.intern("/form-471")
+URL_APPEALS = sys.intern("/appeals")
+URL_FAQ = sys.intern("/faq")
+URL_CASE_STUDIES = sys.intern("/case-studies")
+URL_BEGINNERS_GUIDE = sys.intern("/blog/e-rate-beginners-guide")
+URL_DEADLINES_2026 = sys.intern("/blog/e-rate-deadlines-2026")
+URL_COMMON_MISTAKES = sys.intern("/blog/common-e-rate-mistakes")
+URL_WIN_APPEAL = sys.intern("/blog/how-to-win-e-rate-appeal")
+
+
+@functools.cache
+def _gaps() -> Dict[str, List[Dict[str, str]]]:
+    """Content gaps by category."""
+    return {
+        "missing_pillar_pages": [
+            {
+                "topic": "E-Rate Application Process",
+                "recommended_url": "/e-rate-application-help",
+                "priority": "critical",
+                "reason": "Core service offering needs dedicated landing page"
+            },
+            {
+                "topic": "E-Rate Appeals",
+                "recommended_url": "/appeals",
+                "priority": "high",
+                "reason": "High-value service with low-competition keywords"
+            }
+        ],
+        "missing_audience_pages": [
+            {
+                "audience": "Charter Schools",
+                "recommended_url": "/charter-schools",
+                "priority": "high",
+                "reason": "Growing market segment with specific needs"
+            },
+            {
+                "audience": "Private/Religious Schools",
+                "recommended_url": "/private-schools",
+                "priority": "medium",
+                "reason": "Eligibility confusion creates consulting opportunity"
+            },
+            {
+                "audience": "Libraries",
+                "recommended_url": "/library-e-rate",
+                "priority": "medium",
+                "reason": "Distinct audience with different requirements"
+            }
+        ],
+        "missing_educational_content": [
+            {
+                "topic": "E-Rate Deadlines Calendar",
+                "recommended_url": "/blog/e-rate-deadlines-2026",
+                "priority": "critical",
+                "reason": "High seasonal search volume, time-sensitive content"
+            },
+            {
+                "topic": "E-Rate Beginner's Guide",
+                "recommended_url": "/blog/e-rate-beginners-guide",
+                "priority": "high",
+                "reason": "Top-of-funnel awareness content"
+            },
+            {
+                "topic": "Common E-Rate Mistakes",
+                "recommended_url": "/blog/common-e-rate-mistakes",
+                "priority": "high",
+                "reason": "Problem-aware content driving consulting interest"
+            },
+            {
+                "topic": "Category 1 vs Category 2 Explained",
+                "recommended_url": "/blog/category-1-vs-category-2",
+                "priority": "medium",
+                "reason": "Educational content for funnel progression"
+            }
+        ],
+        "missing_conversion_content": [
+            {
+                "topic": "Case Studies / Success Stories",
+                "recommended_url": "/case-studies",
+                "priority": "high",
+                "reason": "Social proof for BOFU conversion"
+            },
+            {
+                "topic": "FAQ Page",
+                "recommended_url": "/faq",
+                "priority": "high",
+                "reason": "Schema opportunity + objection handling"
+            }
+        ]
+    }
+
+
+@functools.cache
+def _gaps_total() -> int:
+    """Number of gaps across all categories (static, so computed once)."""
+    return sum(len(v) for v in _gaps().values())
+
+
+@functools.cache
+def _pages() -> Dict[str, ContentPiece]:
+    """Registry of planned content pieces, one shared instance per URL."""
+    pieces = (
+        ContentPiece(
+            title="Complete Guide to E-Rate Application Assistance",
+            url=URL_APPLICATION_HELP,
+            content_type=ContentType.PILLAR_PAGE,
+            funnel_stage=FunnelStage.MOFU,
+            primary_keyword="e-rate application assistance",
+            secondary_keywords=("e-rate help", "e-rate consultant"),
+            word_count_target=3000,
+            internal_links_to=(URL_FORM_470, URL_FORM_471, URL_CASE_STUDIES),
+            internal_links_from=(URL_HOME, URL_BEGINNERS_GUIDE)
+        ),
+        ContentPiece(
+            title="E-Rate Form 470 Help: Start Your Application Right",
+            url=URL_FORM_470,
+            content_type=ContentType.LANDING_PAGE,
+            funnel_stage=FunnelStage.MOFU,
+            primary_keyword="e-rate form 470 help",
+            secondary_keywords=("form 470 filing", "competitive bidding"),
+            word_count_target=1500,
+            internal_links_to=(URL_FORM_471, URL_APPLICATION_HELP),
+            internal_links_from=(URL_APPLICATION_HELP, URL_BEGINNERS_GUIDE)
+        ),
+        ContentPiece(
+            title="Form 471 Filing Service: Meet Your Deadline",
+            url=URL_FORM_471,
+            content_type=ContentType.LANDING_PAGE,
+            funnel_stage=FunnelStage.BOFU,
+            primary_keyword="e-rate form 471 filing service",
+            secondary_keywords=("form 471 deadline", "form 471 help"),
+            word_count_target=1500,
+            internal_links_to=(URL_APPEALS, URL_APPLICATION_HELP),
+            internal_links_from=(URL_FORM_470, URL_DEADLINES_2026)
+        ),
+        ContentPiece(
+            title="E-Rate Appeal Help: Recover Your Denied Funding",
+            url=URL_APPEALS,
+            content_type=ContentType.PILLAR_PAGE,
+            funnel_stage=FunnelStage.BOFU,
+            primary_keyword="e-rate appeal help",
+            secondary_keywords=("usac appeal", "fcc appeal"),
+            word_count_target=2500,
+            internal_links_to=(URL_CASE_STUDIES, URL_APPLICATION_HELP),
+            internal_links_from=(URL_FORM_471, URL_FAQ, URL_COMMON_MISTAKES)
+        ),
+        ContentPiece(
+            title="How to Win an E-Rate Appeal: Expert Strategies",
+            url=URL_WIN_APPEAL,
+            content_type=ContentType.BLOG_POST,
+            funnel_stage=FunnelStage.MOFU,
+            primary_keyword="how to win e-rate appeal",
+            secondary_keywords=("e-rate denial", "appeal process"),
+            word_count_target=2000,
+            internal_links_to=(URL_APPEALS, URL_CASE_STUDIES),
+            internal_links_from=(URL_FAQ,)
+        ),
+        ContentPiece(
+            title="E-Rate Eligibility Requirements: FAQ & Answers",
+            url=URL_FAQ,
+            content_type=ContentType.FAQ,
+            funnel_stage=FunnelStage.TOFU,
+            primary_keyword="e-rate eligibility requirements",
+            secondary_keywords=("e-rate discount", "e-rate funding"),
+            word_count_target=2000,
+            internal_links_to=(URL_APPLICATION_HELP, URL_APPEALS),
+            internal_links_from=(URL_HOME, URL_BEGINNERS_GUIDE)
+        ),
+        ContentPiece(
+            title="What is the E-Rate Program? A Complete Beginner's Guide",
+            url=URL_BEGINNERS_GUIDE,
+            content_type=ContentType.GUIDE,
+            funnel_stage=FunnelStage.TOFU,
+            primary_keyword="what is e-rate program",
+            secondary_keywords=("e-rate explained", "e-rate basics"),
+            word_count_target=2500,
+            internal_links_to=(URL_FAQ, URL_APPLICATION_HELP, URL_HOME)
+        ),
+        ContentPiece(
+            title="E-Rate Deadlines 2026: Complete Calendar",
+            url=URL_DEADLINES_2026,
+            content_type=ContentType.BLOG_POST,
+            funnel_stage=FunnelStage.TOFU,
+            primary_keyword="e-rate deadline 2026",
+            secondary_keywords=("form 471 deadline", "e-rate dates"),
+            word_count_target=1500,
+            internal_links_to=(URL_FORM_471, URL_APPLICATION_HELP)
+        )
+    )
+    return {piece.url: piece for piece in pieces}
+
+
+@functools.cache
+def _link_graph() -> LinkGraph:
+    """Build the CSR internal-link graph over the page registry once."""
+    pages = _pages()
+    urls = list(pages)
+    index = {url: i for i, url in enumerate(urls)}
+    # Link targets outside the registry (e.g. "/", "/case-studies") still
+    # need node ids so their inlinks are counted
+    for piece in pages.values():
+        for dest in piece.internal_links_to:
+            if dest not in index:
+                index[dest] = len(urls)
+                urls.append(dest)
+    
+    indptr = array("i", [0])
+    indices = array("i")
+    for url in urls:
+        piece = pages.get(url)
+        if piece is not None:
+            indices.extend(index[dest] for dest in piece.internal_links_to)
+        indptr.append(len(indices))
+    
+    inlink_counts = array("i", [0]) * len(urls)
+    for node in indices:
+        inlink_counts[node] += 1
+    
+    return LinkGraph(tuple(urls), index, indptr, indices, inlink_counts)
+
+
+@functools.cache
+def _clusters() -> Tuple[TopicCluster, ...]:
+    """Semantic topic clusters: one pillar page plus its cluster pages."""
+    pages = _pages()
+    return (
+        TopicCluster(
+            name="E-Rate Application Process",
+            pillar_page=pages[URL_APPLICATION_HELP],
+            cluster_pages=(pages[URL_FORM_470], pages[URL_FORM_471]),
+            related_keywords=("e-rate application", "form 470", "form 471", "pia review")
+        ),
+        TopicCluster(
+            name="E-Rate Appeals & Recovery",
+            pillar_page=pages[URL_APPEALS],
+            cluster_pages=(pages[URL_WIN_APPEAL],),
+            related_keywords=("e-rate denied", "usac appeal", "fcc appeal", "funding recovery")
+        ),
+        TopicCluster(
+            name="E-Rate Education & Awareness",
+            pillar_page=pages[URL_FAQ],
+            cluster_pages=(pages[URL_BEGINNERS_GUIDE], pages[URL_DEADLINES_2026]),
+            related_keywords=("e-rate program", "e-rate eligibility", "e-rate discount")
+        )
+    )
+
+
+@functools.cache
+def _cluster_pages_total() -> int:
+    """Number of cluster pages across all topic clusters (computed once)."""
+    return sum(c._n_pages for c in _clusters())
+
+
+@functools.cache
+def _clusters_summary() -> List[Dict[str, Any]]:
+    """Summaries of every topic cluster (clusters are frozen, so built once)."""
+    return [c.to_summary() for c in _clusters()]
+
+
+@functools.cache
+def _keyword_trie() -> KeywordTrie:
+    """Trie over every planned page and cluster keyword."""
+    trie = KeywordTrie()
+    for piece in _pages().values():
+        trie.insert(piece.primary_keyword)
+        for keyword in piece.secondary_keywords:
+            trie.insert(keyword)
+    for cluster in _clusters():
+        for keyword in cluster.related_keywords:
+            trie.insert(keyword)
+    return trie
+
+
+@functools.cache
+def _calendar() -> Dict[str, Dict[str, Any]]:
+    """Six-month content calendar, keyed by month."""
+    pages = _pages()
+    return {
+        "month_1": {
+            "theme": "Foundation & Urgency",
+            "content": [
+                {
+                    "week": 1,
+                    "title": "E-Rate Deadlines 2026",
+                    "url": URL_DEADLINES_2026,
+                    "type": pages[URL_DEADLINES_2026].content_type.value,
+                    "priority": "critical",
+                    "reason": "Capture deadline-related searches"
+                },
+                {
+                    "week": 2,
+                    "title": "E-Rate Application Help (Pillar)",
+                    "url": URL_APPLICATION_HELP,
+                    "type": pages[URL_APPLICATION_HELP].content_type.value,
+                    "priority": "critical",
+                    "reason": "Core conversion page"
+                },
+                {
+                    "week": 3,
+                    "title": "Form 471 Filing Service",
+                    "url": URL_FORM_471,
+                    "type": pages[URL_FORM_471].content_type.value,
+                    "priority": "high",
+                    "reason": "Deadline-driven conversions"
+                },
+                {
+                    "week": 4,
+                    "title": "E-Rate Beginner's Guide",
+                    "url": URL_BEGINNERS_GUIDE,
+                    "type": pages[URL_BEGINNERS_GUIDE].content_type.value,
+                    "priority": "high",
+                    "reason": "TOFU awareness content"
+                }
+            ]
+        },
+        "month_2": {
+            "theme": "Problem & Solution Content",
+            "content": [
+                {
+                    "week": 1,
+                    "title": "Common E-Rate Mistakes",
+                    "url": "/blog/common-e-rate-mistakes",
+                    "type": "blog_post",
+                    "priority": "high",
+                    "reason": "Problem-aware traffic"
+                },
+                {
+                    "week": 2,
+                    "title": "E-Rate Appeals Page",
+                    "url": URL_APPEALS,
+                    "type": pages[URL_APPEALS].content_type.value,
+                    "priority": "high",
+                    "reason": "High-value service page"
+                },
+                {
+                    "week": 3,
+                    "title": "Form 470 Help",
+                    "url": URL_FORM_470,
+                    "type": pages[URL_FORM_470].content_type.value,
+                    "priority": "medium",
+                    "reason": "Application cluster page"
+                },
+                {
+                    "week": 4,
+                    "title": "FAQ Page",
+                    "url": URL_FAQ,
+                    "type": pages[URL_FAQ].content_type.value,
+                    "priority": "high",
+                    "reason": "Schema opportunity + objections"
+                }
+            ]
+        },
+        "month_3": {
+            "theme": "Audience Segmentation",
+            "content": [
+                {
+                    "week": 1,
+                    "title": "E-Rate for Charter Schools",
+                    "url": "/charter-schools",
+                    "type": "landing_page",
+                    "priority": "high",
+                    "reason": "Niche audience targeting"
+                },
+                {
+                    "week": 2,
+                    "title": "Case Studies",
+                    "url": "/case-studies",
+                    "type": "case_study",
+                    "priority": "high",
+                    "reason": "Social proof for conversions"
+                },
+                {
+                    "week": 3,
+                    "title": "E-Rate for Private Schools",
+                    "url": "/private-schools",
+                    "type": "landing_page",
+                    "priority": "medium",
+                    "reason": "Audience segment"
+                },
+                {
+                    "week": 4,
+                    "title": "Category 1 vs Category 2",
+                    "url": "/blog/category-1-vs-category-2",
+                    "type": "blog_post",
+                    "priority": "medium",
+                    "reason": "Educational content"
+                }
+            ]
+        },
+        "month_4_6": {
+            "theme": "Authority Building & Expansion",
+            "content": [
+                {
+                    "title": "E-Rate for Libraries",
+                    "url": "/library-e-rate",
+                    "type": "landing_page"
+                },
+                {
+                    "title": "How to Win E-Rate Appeals",
+                    "url": URL_WIN_APPEAL,
+                    "type": pages[URL_WIN_APPEAL].content_type.value
+                },
+                {
+                    "title": "E-Rate PIA Review Guide",
+                    "url": "/blog/pia-review-guide",
+                    "type": "guide"
+                },
+                {
+                    "title": "State-specific E-Rate Guides",
+                    "url": "/blog/e-rate-by-state",
+                    "type": "blog_post"
+                }
+            ]
+        }
+    }
+
+
+@functools.cache
+def _calendar_entries() -> Tuple[CalendarEntry, ...]:
+    """Flattened calendar rows in schedule order (month, then week)."""
+    return tuple(
+        CalendarEntry(
+            month=month,
+            week=item.get("week"),
+            priority=item.get("priority"),
+            type=item["type"],
+            url=item["url"],
+            title=item["title"]
+        )
+        for month, plan in _calendar().items()
+        for item in plan["content"]
+    )
+
+
+@functools.cache
+def _calendar_index() -> Dict[Tuple[str, Any], Tuple[CalendarEntry, ...]]:
+    """Calendar rows grouped by ("priority"|"type"|"week", value)."""
+    index: Dict[Tuple[str, Any], List[CalendarEntry]] = {}
+    for entry in _calendar_entries():
+        for key in (("priority", entry.priority), ("type", entry.type), ("week", entry.week)):
+            index.setdefault(key, []).append(entry)
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
+@functools.cache
+def _outlines() -> Dict[str, Dict[str, Any]]:
+    """Detailed blog outlines, keyed by topic slug."""
+    return {
+        "e-rate-beginners-guide": {
+            "title": "What is the E-Rate Program? A Complete Beginner's Guide",
+            "meta_description": "Learn everything about the E-Rate program for schools and libraries. Understand eligibility, discounts up to 90%, application process, and how to maximize your funding.",
+            "word_count_target": 2500,
+            "target_keyword": "what is e-rate program",
+            "outline": [
+                {
+                    "h2": "What is the E-Rate Program?",
+                    "content_notes": "Definition, history, funding cap ($4.456B), purpose. Featured snippet opportunity.",
+                    "word_count": 300
+                },
+                {
+                    "h2": "Who is Eligible for E-Rate Funding?",
+                    "subsections": [
+                        "K-12 Schools (Public and Private)",
+                        "Libraries (Public and Private)",
+                        "Consortia and State Networks"
+                    ],
+                    "content_notes": "Clear eligibility criteria. Link to /faq for detailed requirements.",
+                    "word_count": 400
+                },
+                {
+                    "h2": "E-Rate Discount Rates Explained",
+                    "content_notes": "20-90% based on NSLP. Include table. Link to discount calculator if available.",
+                    "word_count": 300
+                },
+                {
+                    "h2": "What Services Does E-Rate Cover?",
+                    "subsections": [
+                        "Category 1: Internet Access & Transport",
+                        "Category 2: Internal Connections & Managed Services"
+                    ],
+                    "content_notes": "Detailed breakdown. Link to /blog/category-1-vs-category-2.",
+                    "word_count": 400
+                },
+                {
+                    "h2": "The E-Rate Application Process: Step by Step",
+                    "subsections": [
+                        "Step 1: Create EPC Account",
+                        "Step 2: File Form 470",
+                        "Step 3: Competitive Bidding",
+                        "Step 4: File Form 471",
+                        "Step 5: PIA Review",
+                        "Step 6: Receive Funding"
+                    ],
+                    "content_notes": "Numbered process. Internal link to /e-rate-application-help.",
+                    "word_count": 500
+                },
+                {
+                    "h2": "Important E-Rate Deadlines",
+                    "content_notes": "Calendar overview. Strong link to /blog/e-rate-deadlines-2026.",
+                    "word_count": 200
+                },
+                {
+                    "h2": "Common E-Rate Mistakes to Avoid",
+                    "content_notes": "Top 5 mistakes. Link to /blog/common-e-rate-mistakes and /appeals.",
+                    "word_count": 300
+                },
+                {
+                    "h2": "Should You Use an E-Rate Consultant?",
+                    "content_notes": "DIY vs consultant comparison. Link to homepage CTA.",
+                    "word_count": 200,
+                    "cta": "Get expert E-Rate application assistance →"
+                }
+            ],
+            "internal_links": [
+                {"anchor": "professional E-Rate application assistance", "url": "/e-rate-application-help"},
+                {"anchor": "E-Rate eligibility requirements", "url": "/faq"},
+                {"anchor": "E-Rate deadline calendar", "url": "/blog/e-rate-deadlines-2026"},
+                {"anchor": "trusted E-Rate consultants", "url": "/"}
+            ]
+        },
+        "e-rate-deadlines-2026": {
+            "title": "E-Rate Deadlines 2026: Complete Calendar of Important Dates",
+            "meta_description": "All critical E-Rate deadlines for FY2026. Form 470 and Form 471 filing windows, PIA review timelines, and funding commitment dates.",
+            "word_count_target": 1500,
+            "target_keyword": "e-rate deadline 2026",
+            "outline": [
+                {
+                    "h2": "E-Rate FY2026 Key Dates Overview",
+                    "content_notes": "Quick reference table with all dates. Featured snippet target.",
+                    "word_count": 200
+                },
+                {
+                    "h2": "Form 470 Filing Window (Fall 2025)",
+                    "content_notes": "October-November timeline. Link to /form-470.",
+                    "word_count": 250
+                },
+                {
+                    "h2": "Competitive Bidding Period",
+                    "content_notes": "28-day minimum requirement. RFP best practices.",
+                    "word_count": 200
+                },
+                {
+                    "h2": "Form 471 Filing Window (January-March 2026)",
+                    "content_notes": "Critical deadline emphasis. STRONG link to /form-471.",
+                    "word_count": 300
+                },
+                {
+                    "h2": "PIA Review Timeline",
+                    "content_notes": "What to expect, response deadlines.",
+                    "word_count": 200
+                },
+                {
+                    "h2": "Funding Commitment Letters",
+                    "content_notes": "Wave schedule expectations.",
+                    "word_count": 150
+                },
+                {
+                    "h2": "Don't Miss Your Deadline: Get Expert Help",
+                    "content_notes": "Urgency CTA. Link to /e-rate-application-help.",
+                    "word_count": 200,
+                    "cta": "Ensure you meet every deadline with professional support →"
+                }
+            ],
+            "internal_links": [
+                {"anchor": "Form 471 filing service", "url": "/form-471"},
+                {"anchor": "get started with your E-Rate application", "url": "/e-rate-application-help"},
+                {"anchor": "Form 470 assistance", "url": "/form-470"}
+            ]
+        }
+    }
+
+
+@functools.cache
+def _funnel_map() -> Dict[str, Dict[str, Any]]:
+    """Content mapped to TOFU/MOFU/BOFU funnel stages."""
+    return {
+        "tofu": {
+            "stage": "Awareness",
+            "user_intent": "Learning about E-Rate, researching basics",
+            "content": [
+                {"title": "What is E-Rate Program", "url": "/blog/e-rate-beginners-guide"},
+                {"title": "E-Rate Deadlines 2026", "url": "/blog/e-rate-deadlines-2026"},
+                {"title": "E-Rate Eligibility FAQ", "url": "/faq"},
+                {"title": "Category 1 vs Category 2", "url": "/blog/category-1-vs-category-2"}
+            ],
+            "cta_type": "Learn More / Download Guide",
+            "conversion_goal": "Email signup, resource download"
+        },
+        "mofu": {
+            "stage": "Consideration",
+            "user_intent": "Comparing options, evaluating consultants",
+            "content": [
+                {"title": "E-Rate Application Help", "url": "/e-rate-application-help"},
+                {"title": "Common E-Rate Mistakes", "url": "/blog/common-e-rate-mistakes"},
+                {"title": "Form 470 Help", "url": "/form-470"},
+                {"title": "DIY vs Consultant (comparison table)", "url": "/ (section)"}
+            ],
+            "cta_type": "Free Consultation / Assessment",
+            "conversion_goal": "Schedule call, request quote"
+        },
+        "bofu": {
+            "stage": "Decision",
+            "user_intent": "Ready to hire, needs final push",
+            "content": [
+                {"title": "Form 471 Filing Service", "url": "/form-471"},
+                {"title": "E-Rate Appeals", "url": "/appeals"},
+                {"title": "Case Studies", "url": "/case-studies"},
+                {"title": "Charter Schools", "url": "/charter-schools"},
+                {"title": "Private Schools", "url": "/private-schools"},
+                {"title": "Libraries", "url": "/library-e-rate"}
+            ],
+            "cta_type": "Get Started / Contact Now",
+            "conversion_goal": "Sign up, submit application"
+        }
+    }
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert a task context into a hashable memo key.
+    
+    Containers are tagged and scalars carry their type, so contexts that
+    merely compare equal (a dict vs. its item pairs, 1 vs. True vs. 1.0)
+    never share a key.
+    """
+    if isinstance(value, dict):
+        return ("d", frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return ("l", tuple(_freeze(v) for v in value))
+    if isinstance(value, tuple):
+        return ("t", tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return ("s", frozenset(_freeze(v) for v in value))
+    return (type(value), value)
 
 
 class ContentStrategist:
@@ -69,6 +776,20 @@ class ContentStrategist:
     - TOFU/MOFU/BOFU mapping
     """
     
+    __slots__ = ("industry", "target_audience", "content_plan", "topic_clusters", "_task_cache", "_task_lock", "TASKS")
+    
+    # Max (task, context) results kept by execute_task's memo
+    TASK_CACHE_SIZE: ClassVar[int] = 64
+    
+    # Task name -> handler method name, resolved by execute_task
+    _TASK_HANDLERS: ClassVar[Dict[str, str]] = {
+        "content_gap_analysis": "analyze_content_gaps",
+        "create_topic_clusters": "create_topic_clusters",
+        "build_content_calendar": "build_content_calendar",
+        "generate_blog_outline": "generate_blog_outline",
+        "map_funnel_content": "map_funnel_content",
+    }
+    
     def __init__(self):
         self.industry = "SkyRate"
         self.target_audience = [
@@ -79,6 +800,13 @@ class ContentStrategist:
         ]
         self.content_plan: List[ContentPiece] = []
         self.topic_clusters: List[TopicCluster] = []
+        self._task_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._task_lock = threading.Lock()
+        # Task name -> callable for the orchestrator's router; goes through
+        # execute_task so routed calls still hit the memo
+        self.TASKS: Dict[str, Callable[[Dict], Dict]] = {
+            task: functools.partial(self.execute_task, task) for task in self._TASK_HANDLERS
+        }
         
     def execute_task(self, task: str, context: Dict) -> Dict:
         """
@@ -91,19 +819,102 @@ class ContentStrategist:
         Returns:
             Dict containing task results
         """
-        task_handlers = {
-            "content_gap_analysis": self.analyze_content_gaps,
-            "create_topic_clusters": self.create_topic_clusters,
-            "build_content_calendar": self.build_content_calendar,
-            "generate_blog_outline": self.generate_blog_outline,
-            "map_funnel_content": self.map_funnel_content
-        }
-        
-        handler = task_handlers.get(task)
-        if handler:
-            return handler(context)
-        else:
+        name = self._TASK_HANDLERS.get(task)
+        if not name:
             return {"error": f"Unknown task: {task}"}
+        
+        # Handlers are pure functions of their context, so repeat delegations
+        # with an equal context return the memoized (read-only) result. The
+        # lock guards the LRU bookkeeping, since execute_tasks calls this from
+        # worker threads; handlers themselves run outside it.
+        try:
+            key = (task, _freeze(context))
+            with self._task_lock:
+                cached = self._task_cache.get(key)
+                if cached is not None:
+                    self._task_cache.move_to_end(key)
+        except TypeError:  # unhashable context value; skip the memo
+            return getattr(self, name)(context)
+        
+        if cached is not None:
+            return cached
+        
+        result = getattr(self, name)(context)
+        with self._task_lock:
+            self._task_cache[key] = result
+            if len(self._task_cache) > self.TASK_CACHE_SIZE:
+                self._task_cache.popitem(last=False)
+        return result
+    
+    async def execute_tasks(self, tasks: List[Tuple[str, Dict]]) -> List[Dict]:
+        """
+        Execute a batch of delegated content tasks concurrently.
+        
+        Each task runs in a worker thread via asyncio.to_thread, so handlers
+        that later call LLMs or fetch competitor data overlap their I/O.
+        
+        Args:
+            tasks: (task, context) pairs, as accepted by execute_task
+            
+        Returns:
+            Task results in the same order as the input pairs
+        """
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(self.execute_task, task, context)
+            for task, context in tasks
+        )))
+    
+    def to_json(self, payload: Dict) -> bytes:
+        """
+        Encode a task payload as JSON bytes.
+        
+        Payloads contain only JSON primitives and str enums, so they are
+        orjson-native; prefer this over json.dumps when orjson is installed.
+        """
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload).encode("utf-8")
+    
+    def tag_keywords(self, query: str) -> List[Tuple[int, int, str]]:
+        """
+        Tag planned keywords found in a search query or draft text.
+        
+        Returns:
+            List of (start, end, keyword) spans, ordered by start position
+        """
+        return _keyword_trie().tag(query)
+    
+    def filter_calendar(
+        self,
+        priority: Optional[str] = None,
+        content_type: Optional[str] = None,
+        week: Optional[int] = None
+    ) -> List[CalendarEntry]:
+        """
+        Filter the content calendar without walking the nested month dicts.
+        
+        Args:
+            priority: e.g. "critical", "high"
+            content_type: ContentType value, e.g. "blog_post"
+            week: Week number within the month
+        
+        Returns:
+            Matching CalendarEntry rows in schedule order
+        """
+        index = _calendar_index()
+        criteria = [
+            key for key in (("priority", priority), ("type", content_type), ("week", week))
+            if key[1] is not None
+        ]
+        if not criteria:
+            return list(_calendar_entries())
+        # Start from the smallest bucket and check the rest per row.
+        buckets = sorted((index.get(key, ()) for key in criteria), key=len)
+        matches = buckets[0]
+        for bucket in buckets[1:]:
+            allowed = set(bucket)
+            matches = [entry for entry in matches if entry in allowed]
+        return list(matches)
     
     # =========================================================================
     # CONTENT GAP ANALYSIS
@@ -120,90 +931,13 @@ class ContentStrategist:
         """
         existing_pages = context.get("existing_pages", [])
         
-        gaps = {
-            "missing_pillar_pages": [
-                {
-                    "topic": "E-Rate Application Process",
-                    "recommended_url": "/e-rate-application-help",
-                    "priority": "critical",
-                    "reason": "Core service offering needs dedicated landing page"
-                },
-                {
-                    "topic": "E-Rate Appeals",
-                    "recommended_url": "/appeals",
-                    "priority": "high",
-                    "reason": "High-value service with low-competition keywords"
-                }
-            ],
-            "missing_audience_pages": [
-                {
-                    "audience": "Charter Schools",
-                    "recommended_url": "/charter-schools",
-                    "priority": "high",
-                    "reason": "Growing market segment with specific needs"
-                },
-                {
-                    "audience": "Private/Religious Schools",
-                    "recommended_url": "/private-schools",
-                    "priority": "medium",
-                    "reason": "Eligibility confusion creates consulting opportunity"
-                },
-                {
-                    "audience": "Libraries",
-                    "recommended_url": "/library-e-rate",
-                    "priority": "medium",
-                    "reason": "Distinct audience with different requirements"
-                }
-            ],
-            "missing_educational_content": [
-                {
-                    "topic": "E-Rate Deadlines Calendar",
-                    "recommended_url": "/blog/e-rate-deadlines-2026",
-                    "priority": "critical",
-                    "reason": "High seasonal search volume, time-sensitive content"
-                },
-                {
-                    "topic": "E-Rate Beginner's Guide",
-                    "recommended_url": "/blog/e-rate-beginners-guide",
-                    "priority": "high",
-                    "reason": "Top-of-funnel awareness content"
-                },
-                {
-                    "topic": "Common E-Rate Mistakes",
-                    "recommended_url": "/blog/common-e-rate-mistakes",
-                    "priority": "high",
-                    "reason": "Problem-aware content driving consulting interest"
-                },
-                {
-                    "topic": "Category 1 vs Category 2 Explained",
-                    "recommended_url": "/blog/category-1-vs-category-2",
-                    "priority": "medium",
-                    "reason": "Educational content for funnel progression"
-                }
-            ],
-            "missing_conversion_content": [
-                {
-                    "topic": "Case Studies / Success Stories",
-                    "recommended_url": "/case-studies",
-                    "priority": "high",
-                    "reason": "Social proof for BOFU conversion"
-                },
-                {
-                    "topic": "FAQ Page",
-                    "recommended_url": "/faq",
-                    "priority": "high",
-                    "reason": "Schema opportunity + objection handling"
-                }
-            ]
-        }
-        
         return {
             "status": "complete",
             "existing_pages_analyzed": len(existing_pages),
-            "total_gaps_identified": sum(len(v) for v in gaps.values()),
+            "total_gaps_identified": _gaps_total(),
             "critical_gaps": 2,
             "high_priority_gaps": 6,
-            "gaps": gaps,
+            "gaps": _gaps(),
             "recommendation": "Prioritize pillar pages and deadline content for immediate SEO impact"
         }
     
@@ -220,131 +954,15 @@ class ContentStrategist:
         - Multiple cluster pages (specific subtopics)
         - Internal linking between all pages
         """
-        clusters = [
-            TopicCluster(
-                name="E-Rate Application Process",
-                pillar_page=ContentPiece(
-                    title="Complete Guide to E-Rate Application Assistance",
-                    url="/e-rate-application-help",
-                    content_type=ContentType.PILLAR_PAGE,
-                    funnel_stage=FunnelStage.MOFU,
-                    primary_keyword="e-rate application assistance",
-                    secondary_keywords=["e-rate help", "e-rate consultant"],
-                    word_count_target=3000,
-                    internal_links_to=["/form-470", "/form-471", "/case-studies"],
-                    internal_links_from=["/", "/blog/e-rate-beginners-guide"]
-                ),
-                cluster_pages=[
-                    ContentPiece(
-                        title="E-Rate Form 470 Help: Start Your Application Right",
-                        url="/form-470",
-                        content_type=ContentType.LANDING_PAGE,
-                        funnel_stage=FunnelStage.MOFU,
-                        primary_keyword="e-rate form 470 help",
-                        secondary_keywords=["form 470 filing", "competitive bidding"],
-                        word_count_target=1500,
-                        internal_links_to=["/form-471", "/e-rate-application-help"],
-                        internal_links_from=["/e-rate-application-help", "/blog/e-rate-beginners-guide"]
-                    ),
-                    ContentPiece(
-                        title="Form 471 Filing Service: Meet Your Deadline",
-                        url="/form-471",
-                        content_type=ContentType.LANDING_PAGE,
-                        funnel_stage=FunnelStage.BOFU,
-                        primary_keyword="e-rate form 471 filing service",
-                        secondary_keywords=["form 471 deadline", "form 471 help"],
-                        word_count_target=1500,
-                        internal_links_to=["/appeals", "/e-rate-application-help"],
-                        internal_links_from=["/form-470", "/blog/e-rate-deadlines-2026"]
-                    )
-                ],
-                related_keywords=["e-rate application", "form 470", "form 471", "pia review"]
-            ),
-            TopicCluster(
-                name="E-Rate Appeals & Recovery",
-                pillar_page=ContentPiece(
-                    title="E-Rate Appeal Help: Recover Your Denied Funding",
-                    url="/appeals",
-                    content_type=ContentType.PILLAR_PAGE,
-                    funnel_stage=FunnelStage.BOFU,
-                    primary_keyword="e-rate appeal help",
-                    secondary_keywords=["usac appeal", "fcc appeal"],
-                    word_count_target=2500,
-                    internal_links_to=["/case-studies", "/e-rate-application-help"],
-                    internal_links_from=["/form-471", "/faq", "/blog/common-e-rate-mistakes"]
-                ),
-                cluster_pages=[
-                    ContentPiece(
-                        title="How to Win an E-Rate Appeal: Expert Strategies",
-                        url="/blog/how-to-win-e-rate-appeal",
-                        content_type=ContentType.BLOG_POST,
-                        funnel_stage=FunnelStage.MOFU,
-                        primary_keyword="how to win e-rate appeal",
-                        secondary_keywords=["e-rate denial", "appeal process"],
-                        word_count_target=2000,
-                        internal_links_to=["/appeals", "/case-studies"],
-                        internal_links_from=["/faq"]
-                    )
-                ],
-                related_keywords=["e-rate denied", "usac appeal", "fcc appeal", "funding recovery"]
-            ),
-            TopicCluster(
-                name="E-Rate Education & Awareness",
-                pillar_page=ContentPiece(
-                    title="E-Rate Eligibility Requirements: FAQ & Answers",
-                    url="/faq",
-                    content_type=ContentType.FAQ,
-                    funnel_stage=FunnelStage.TOFU,
-                    primary_keyword="e-rate eligibility requirements",
-                    secondary_keywords=["e-rate discount", "e-rate funding"],
-                    word_count_target=2000,
-                    internal_links_to=["/e-rate-application-help", "/appeals"],
-                    internal_links_from=["/", "/blog/e-rate-beginners-guide"]
-                ),
-                cluster_pages=[
-                    ContentPiece(
-                        title="What is the E-Rate Program? A Complete Beginner's Guide",
-                        url="/blog/e-rate-beginners-guide",
-                        content_type=ContentType.GUIDE,
-                        funnel_stage=FunnelStage.TOFU,
-                        primary_keyword="what is e-rate program",
-                        secondary_keywords=["e-rate explained", "e-rate basics"],
-                        word_count_target=2500,
-                        internal_links_to=["/faq", "/e-rate-application-help", "/"],
-                        internal_links_from=[]
-                    ),
-                    ContentPiece(
-                        title="E-Rate Deadlines 2026: Complete Calendar",
-                        url="/blog/e-rate-deadlines-2026",
-                        content_type=ContentType.BLOG_POST,
-                        funnel_stage=FunnelStage.TOFU,
-                        primary_keyword="e-rate deadline 2026",
-                        secondary_keywords=["form 471 deadline", "e-rate dates"],
-                        word_count_target=1500,
-                        internal_links_to=["/form-471", "/e-rate-application-help"],
-                        internal_links_from=[]
-                    )
-                ],
-                related_keywords=["e-rate program", "e-rate eligibility", "e-rate discount"]
-            )
-        ]
-        
-        self.topic_clusters = clusters
+        clusters = _clusters()
+        self.topic_clusters = list(clusters)
         
         return {
             "status": "complete",
             "total_clusters": len(clusters),
             "total_pillar_pages": len(clusters),
-            "total_cluster_pages": sum(len(c.cluster_pages) for c in clusters),
-            "clusters": [
-                {
-                    "name": c.name,
-                    "pillar": c.pillar_page.url,
-                    "cluster_pages": [p.url for p in c.cluster_pages],
-                    "keywords": c.related_keywords
-                }
-                for c in clusters
-            ]
+            "total_cluster_pages": _cluster_pages_total(),
+            "clusters": _clusters_summary()
         }
     
     # =========================================================================
@@ -360,153 +978,12 @@ class ContentStrategist:
         - High-intent conversion pages
         - Supporting educational content
         """
-        start_date = datetime.now()
-        
-        calendar = {
-            "month_1": {
-                "theme": "Foundation & Urgency",
-                "content": [
-                    {
-                        "week": 1,
-                        "title": "E-Rate Deadlines 2026",
-                        "url": "/blog/e-rate-deadlines-2026",
-                        "type": "blog_post",
-                        "priority": "critical",
-                        "reason": "Capture deadline-related searches"
-                    },
-                    {
-                        "week": 2,
-                        "title": "E-Rate Application Help (Pillar)",
-                        "url": "/e-rate-application-help",
-                        "type": "pillar_page",
-                        "priority": "critical",
-                        "reason": "Core conversion page"
-                    },
-                    {
-                        "week": 3,
-                        "title": "Form 471 Filing Service",
-                        "url": "/form-471",
-                        "type": "landing_page",
-                        "priority": "high",
-                        "reason": "Deadline-driven conversions"
-                    },
-                    {
-                        "week": 4,
-                        "title": "E-Rate Beginner's Guide",
-                        "url": "/blog/e-rate-beginners-guide",
-                        "type": "guide",
-                        "priority": "high",
-                        "reason": "TOFU awareness content"
-                    }
-                ]
-            },
-            "month_2": {
-                "theme": "Problem & Solution Content",
-                "content": [
-                    {
-                        "week": 1,
-                        "title": "Common E-Rate Mistakes",
-                        "url": "/blog/common-e-rate-mistakes",
-                        "type": "blog_post",
-                        "priority": "high",
-                        "reason": "Problem-aware traffic"
-                    },
-                    {
-                        "week": 2,
-                        "title": "E-Rate Appeals Page",
-                        "url": "/appeals",
-                        "type": "pillar_page",
-                        "priority": "high",
-                        "reason": "High-value service page"
-                    },
-                    {
-                        "week": 3,
-                        "title": "Form 470 Help",
-                        "url": "/form-470",
-                        "type": "landing_page",
-                        "priority": "medium",
-                        "reason": "Application cluster page"
-                    },
-                    {
-                        "week": 4,
-                        "title": "FAQ Page",
-                        "url": "/faq",
-                        "type": "faq",
-                        "priority": "high",
-                        "reason": "Schema opportunity + objections"
-                    }
-                ]
-            },
-            "month_3": {
-                "theme": "Audience Segmentation",
-                "content": [
-                    {
-                        "week": 1,
-                        "title": "E-Rate for Charter Schools",
-                        "url": "/charter-schools",
-                        "type": "landing_page",
-                        "priority": "high",
-                        "reason": "Niche audience targeting"
-                    },
-                    {
-                        "week": 2,
-                        "title": "Case Studies",
-                        "url": "/case-studies",
-                        "type": "case_study",
-                        "priority": "high",
-                        "reason": "Social proof for conversions"
-                    },
-                    {
-                        "week": 3,
-                        "title": "E-Rate for Private Schools",
-                        "url": "/private-schools",
-                        "type": "landing_page",
-                        "priority": "medium",
-                        "reason": "Audience segment"
-                    },
-                    {
-                        "week": 4,
-                        "title": "Category 1 vs Category 2",
-                        "url": "/blog/category-1-vs-category-2",
-                        "type": "blog_post",
-                        "priority": "medium",
-                        "reason": "Educational content"
-                    }
-                ]
-            },
-            "month_4_6": {
-                "theme": "Authority Building & Expansion",
-                "content": [
-                    {
-                        "title": "E-Rate for Libraries",
-                        "url": "/library-e-rate",
-                        "type": "landing_page"
-                    },
-                    {
-                        "title": "How to Win E-Rate Appeals",
-                        "url": "/blog/how-to-win-e-rate-appeal",
-                        "type": "blog_post"
-                    },
-                    {
-                        "title": "E-Rate PIA Review Guide",
-                        "url": "/blog/pia-review-guide",
-                        "type": "guide"
-                    },
-                    {
-                        "title": "State-specific E-Rate Guides",
-                        "url": "/blog/e-rate-by-state",
-                        "type": "blog_post"
-                    }
-                ]
-            }
-        }
-        
         return {
             "status": "complete",
             "calendar_duration": "6 months",
             "total_content_pieces": 16,
             "critical_items": 3,
-            "calendar": calendar,
+            "calendar": _calendar(),
             "publishing_frequency": "1 piece per week minimum"
         }
     
@@ -524,130 +1001,7 @@ class ContentStrategist:
         - Internal linking opportunities
         """
         topic = context.get("topic", "e-rate-beginners-guide")
-        
-        outlines = {
-            "e-rate-beginners-guide": {
-                "title": "What is the E-Rate Program? A Complete Beginner's Guide",
-                "meta_description": "Learn everything about the E-Rate program for schools and libraries. Understand eligibility, discounts up to 90%, application process, and how to maximize your funding.",
-                "word_count_target": 2500,
-                "target_keyword": "what is e-rate program",
-                "outline": [
-                    {
-                        "h2": "What is the E-Rate Program?",
-                        "content_notes": "Definition, history, funding cap ($4.456B), purpose. Featured snippet opportunity.",
-                        "word_count": 300
-                    },
-                    {
-                        "h2": "Who is Eligible for E-Rate Funding?",
-                        "subsections": [
-                            "K-12 Schools (Public and Private)",
-                            "Libraries (Public and Private)",
-                            "Consortia and State Networks"
-                        ],
-                        "content_notes": "Clear eligibility criteria. Link to /faq for detailed requirements.",
-                        "word_count": 400
-                    },
-                    {
-                        "h2": "E-Rate Discount Rates Explained",
-                        "content_notes": "20-90% based on NSLP. Include table. Link to discount calculator if available.",
-                        "word_count": 300
-                    },
-                    {
-                        "h2": "What Services Does E-Rate Cover?",
-                        "subsections": [
-                            "Category 1: Internet Access & Transport",
-                            "Category 2: Internal Connections & Managed Services"
-                        ],
-                        "content_notes": "Detailed breakdown. Link to /blog/category-1-vs-category-2.",
-                        "word_count": 400
-                    },
-                    {
-                        "h2": "The E-Rate Application Process: Step by Step",
-                        "subsections": [
-                            "Step 1: Create EPC Account",
-                            "Step 2: File Form 470",
-                            "Step 3: Competitive Bidding",
-                            "Step 4: File Form 471",
-                            "Step 5: PIA Review",
-                            "Step 6: Receive Funding"
-                        ],
-                        "content_notes": "Numbered process. Internal link to /e-rate-application-help.",
-                        "word_count": 500
-                    },
-                    {
-                        "h2": "Important E-Rate Deadlines",
-                        "content_notes": "Calendar overview. Strong link to /blog/e-rate-deadlines-2026.",
-                        "word_count": 200
-                    },
-                    {
-                        "h2": "Common E-Rate Mistakes to Avoid",
-                        "content_notes": "Top 5 mistakes. Link to /blog/common-e-rate-mistakes and /appeals.",
-                        "word_count": 300
-                    },
-                    {
-                        "h2": "Should You Use an E-Rate Consultant?",
-                        "content_notes": "DIY vs consultant comparison. Link to homepage CTA.",
-                        "word_count": 200,
-                        "cta": "Get expert E-Rate application assistance →"
-                    }
-                ],
-                "internal_links": [
-                    {"anchor": "professional E-Rate application assistance", "url": "/e-rate-application-help"},
-                    {"anchor": "E-Rate eligibility requirements", "url": "/faq"},
-                    {"anchor": "E-Rate deadline calendar", "url": "/blog/e-rate-deadlines-2026"},
-                    {"anchor": "trusted E-Rate consultants", "url": "/"}
-                ]
-            },
-            "e-rate-deadlines-2026": {
-                "title": "E-Rate Deadlines 2026: Complete Calendar of Important Dates",
-                "meta_description": "All critical E-Rate deadlines for FY2026. Form 470 and Form 471 filing windows, PIA review timelines, and funding commitment dates.",
-                "word_count_target": 1500,
-                "target_keyword": "e-rate deadline 2026",
-                "outline": [
-                    {
-                        "h2": "E-Rate FY2026 Key Dates Overview",
-                        "content_notes": "Quick reference table with all dates. Featured snippet target.",
-                        "word_count": 200
-                    },
-                    {
-                        "h2": "Form 470 Filing Window (Fall 2025)",
-                        "content_notes": "October-November timeline. Link to /form-470.",
-                        "word_count": 250
-                    },
-                    {
-                        "h2": "Competitive Bidding Period",
-                        "content_notes": "28-day minimum requirement. RFP best practices.",
-                        "word_count": 200
-                    },
-                    {
-                        "h2": "Form 471 Filing Window (January-March 2026)",
-                        "content_notes": "Critical deadline emphasis. STRONG link to /form-471.",
-                        "word_count": 300
-                    },
-                    {
-                        "h2": "PIA Review Timeline",
-                        "content_notes": "What to expect, response deadlines.",
-                        "word_count": 200
-                    },
-                    {
-                        "h2": "Funding Commitment Letters",
-                        "content_notes": "Wave schedule expectations.",
-                        "word_count": 150
-                    },
-                    {
-                        "h2": "Don't Miss Your Deadline: Get Expert Help",
-                        "content_notes": "Urgency CTA. Link to /e-rate-application-help.",
-                        "word_count": 200,
-                        "cta": "Ensure you meet every deadline with professional support →"
-                    }
-                ],
-                "internal_links": [
-                    {"anchor": "Form 471 filing service", "url": "/form-471"},
-                    {"anchor": "get started with your E-Rate application", "url": "/e-rate-application-help"},
-                    {"anchor": "Form 470 assistance", "url": "/form-470"}
-                ]
-            }
-        }
+        outlines = _outlines()
         
         return {
             "status": "complete",
@@ -666,50 +1020,9 @@ class ContentStrategist:
         MOFU: Consideration & Comparison
         BOFU: Decision & Conversion
         """
-        funnel_map = {
-            "tofu": {
-                "stage": "Awareness",
-                "user_intent": "Learning about E-Rate, researching basics",
-                "content": [
-                    {"title": "What is E-Rate Program", "url": "/blog/e-rate-beginners-guide"},
-                    {"title": "E-Rate Deadlines 2026", "url": "/blog/e-rate-deadlines-2026"},
-                    {"title": "E-Rate Eligibility FAQ", "url": "/faq"},
-                    {"title": "Category 1 vs Category 2", "url": "/blog/category-1-vs-category-2"}
-                ],
-                "cta_type": "Learn More / Download Guide",
-                "conversion_goal": "Email signup, resource download"
-            },
-            "mofu": {
-                "stage": "Consideration",
-                "user_intent": "Comparing options, evaluating consultants",
-                "content": [
-                    {"title": "E-Rate Application Help", "url": "/e-rate-application-help"},
-                    {"title": "Common E-Rate Mistakes", "url": "/blog/common-e-rate-mistakes"},
-                    {"title": "Form 470 Help", "url": "/form-470"},
-                    {"title": "DIY vs Consultant (comparison table)", "url": "/ (section)"}
-                ],
-                "cta_type": "Free Consultation / Assessment",
-                "conversion_goal": "Schedule call, request quote"
-            },
-            "bofu": {
-                "stage": "Decision",
-                "user_intent": "Ready to hire, needs final push",
-                "content": [
-                    {"title": "Form 471 Filing Service", "url": "/form-471"},
-                    {"title": "E-Rate Appeals", "url": "/appeals"},
-                    {"title": "Case Studies", "url": "/case-studies"},
-                    {"title": "Charter Schools", "url": "/charter-schools"},
-                    {"title": "Private Schools", "url": "/private-schools"},
-                    {"title": "Libraries", "url": "/library-e-rate"}
-                ],
-                "cta_type": "Get Started / Contact Now",
-                "conversion_goal": "Sign up, submit application"
-            }
-        }
-        
         return {
             "status": "complete",
-            "funnel_map": funnel_map,
+            "funnel_map": _funnel_map(),
             "content_distribution": {
                 "tofu": 4,
                 "mofu": 4,
@@ -0,0 +1,116 @@
+"""
+Keyword Trie for erateapp.com SEO Agents
+========================================
+Character trie over a static keyword set for fast query tagging.
+
+Tagging a query walks the trie from every word start, so the cost is
+O(len(query) x longest keyword) and independent of how many keywords are
+stored.
+
+Usage:
+    from keyword_trie import KeywordTrie
+
+    trie = KeywordTrie(["form 470", "form 471 deadline"])
+    trie.tag("when is the form 471 deadline?")
+    # -> [(12, 29, "form 471 deadline")]
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class TrieNode:
+    """One character step in the trie; `keyword` is set on terminal nodes."""
+    children: Dict[str, "TrieNode"] = field(default_factory=dict)
+    terminal: bool = False
+    keyword: Optional[str] = None
+
+
+class KeywordTrie:
+    """Case-insensitive keyword trie supporting tagging and prefix completion."""
+
+    __slots__ = ("root", "size")
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self.root = TrieNode()
+        self.size = 0
+        for keyword in keywords:
+            self.insert(keyword)
+
+    def insert(self, keyword: str) -> None:
+        """Add a keyword (stored lowercased); duplicates are ignored."""
+        keyword = keyword.lower()
+        node = self.root
+        for ch in keyword:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = TrieNode()
+            node = child
+        if not node.terminal:
+            node.terminal = True
+            node.keyword = keyword
+            self.size += 1
+
+    def __contains__(self, keyword: str) -> bool:
+        node = self._find(keyword.lower())
+        return node is not None and node.terminal
+
+    def __len__(self) -> int:
+        return self.size
+
+    def tag(self, query: str) -> List[Tuple[int, int, str]]:
+        """
+        Find every keyword occurring in the query on word boundaries.
+
+        Returns:
+            List of (start, end, keyword) spans, ordered by start position;
+            offsets index into the original query
+        """
+        text = query.lower()
+        n = len(text)
+        # Lowercasing never shrinks a character but can expand one (e.g. "İ"),
+        # so only then map lowered positions back to the query
+        origin = None
+        if n != len(query):
+            origin = [i for i, ch in enumerate(query) for _ in ch.lower()]
+            origin.append(len(query))
+        spans = []
+        for start in range(n):
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            node = self.root
+            pos = start
+            while pos < n:
+                node = node.children.get(text[pos])
+                if node is None:
+                    break
+                pos += 1
+                if node.terminal and (pos == n or not text[pos].isalnum()):
+                    if origin is None:
+                        spans.append((start, pos, node.keyword))
+                    else:
+                        spans.append((origin[start], origin[pos], node.keyword))
+        return spans
+
+    def complete(self, prefix: str) -> List[str]:
+        """Return all keywords starting with the given prefix, sorted."""
+        node = self._find(prefix.lower())
+        if node is None:
+            return []
+        matches = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.terminal:
+                matches.append(current.keyword)
+            stack.extend(current.children.values())
+        return sorted(matches)
+
+    def _find(self, text: str) -> Optional[TrieNode]:
+        node = self.root
+        for ch in text:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
@@ -11,12 +11,21 @@ This agent is delegated tasks by the SEO Orchestrator and specializes in:
 - Orphan page identification
 """
 
+import sys
+import time
+from array import array
+from collections import Counter, defaultdict
+from itertools import chain
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from functools import cached_property
+from typing import List, Dict, Callable, FrozenSet, Iterator, NamedTuple, Optional, Tuple
 from enum import Enum
 
 
-class LinkType(Enum):
+_LINK_PRIORITIES = ("critical", "high", "medium", "low")
+
+
+class LinkType(str, Enum):
     CONTEXTUAL = "contextual"     # Within body content
     NAVIGATION = "navigation"     # Header/footer nav
     CTA = "cta"                   # Call-to-action button
@@ -24,14 +33,24 @@ class LinkType(Enum):
     BREADCRUMB = "breadcrumb"     # Breadcrumb navigation
 
 
-class SiloType(Enum):
+class SiloType(str, Enum):
     SERVICES = "services"         # Money pages
     AUDIENCE = "audience"         # Segment landing pages
     RESOURCES = "resources"       # Informational/TOFU content
     BLOG = "blog"                 # Blog posts
 
 
-@dataclass
+# Alternative anchor texts keyed by URL token; first matching token wins.
+_ANCHOR_ALTERNATIVES: Dict[str, List[str]] = {
+    "form-470": ["Form 470 help", "470 filing service", "competitive bidding assistance"],
+    "form-471": ["Form 471 assistance", "471 application help", "form 471 experts"],
+    "appeals": ["E-Rate appeal help", "funding denial appeal", "USAC appeal service"],
+    "schools": ["school E-Rate funding", "K-12 E-Rate", "school technology grants"],
+    "libraries": ["library E-Rate", "public library funding", "library broadband grants"]
+}
+
+
+@dataclass(slots=True, frozen=True)
 class InternalLink:
     """Represents an internal link with full context."""
     source_url: str
@@ -41,16 +60,108 @@ class InternalLink:
     priority: str  # critical, high, medium, low
     context: str   # Where in the content to place
     silo: SiloType
+    
+    def __post_init__(self):
+        # URLs repeat across links and silos; share one string object each.
+        object.__setattr__(self, "source_url", sys.intern(self.source_url))
+        object.__setattr__(self, "destination_url", sys.intern(self.destination_url))
 
 
-@dataclass
+@dataclass(slots=True)
 class SiloStructure:
     """Represents a content silo structure."""
     name: str
     silo_type: SiloType
     hub_page: str
-    spoke_pages: List[str]
+    spoke_pages: Tuple[str, ...]
     internal_links: List[InternalLink]
+    
+    def __post_init__(self):
+        self.hub_page = sys.intern(self.hub_page)
+        self.spoke_pages = tuple(sys.intern(page) for page in self.spoke_pages)
+
+
+class LinkGraph(NamedTuple):
+    """
+    Internal-link graph in compressed sparse row (CSR) form.
+    
+    Outlinks of node i are indices[indptr[i]:indptr[i + 1]], with the anchor
+    text of each edge at anchors[anchor_idx[k]]; urls/url_to_id map between
+    node ids and page URLs.
+    """
+    urls: Tuple[str, ...]
+    url_to_id: Dict[str, int]
+    indptr: array
+    indices: array
+    anchor_idx: array
+    anchors: Tuple[str, ...]
+
+
+# Link map rows in InternalLink field order:
+# (source_url, destination_url, anchor_text, link_type, priority, context, silo)
+_LINK_ROWS = (
+    # Homepage links OUT
+    ("/", "/services/e-rate-appeals", "E-Rate appeal services",
+     LinkType.CONTEXTUAL, "high", "Services section or problem section", SiloType.SERVICES),
+    ("/", "/schools/", "e-rate for schools",
+     LinkType.CONTEXTUAL, "high", "Hero section or audience selector", SiloType.AUDIENCE),
+    ("/", "/libraries/", "e-rate for libraries",
+     LinkType.CONTEXTUAL, "high", "Audience selector section", SiloType.AUDIENCE),
+    ("/", "/guides/what-is-e-rate/", "what is E-Rate",
+     LinkType.CONTEXTUAL, "medium", "FAQ or educational section", SiloType.RESOURCES),
+    ("/", "/guides/e-rate-deadlines-2026/", "2026 E-Rate deadlines",
+     LinkType.CTA, "high", "Urgency banner", SiloType.RESOURCES),
+
+    # Schools page links OUT
+    ("/schools/", "/services/form-471-filing", "Form 471 filing assistance",
+     LinkType.CONTEXTUAL, "high", "Application process section", SiloType.SERVICES),
+    ("/schools/", "/guides/e-rate-eligibility-calculator/", "check your discount rate",
+     LinkType.CONTEXTUAL, "high", "Eligibility section", SiloType.RESOURCES),
+    ("/schools/", "/services/e-rate-appeals", "appeal denied funding",
+     LinkType.CONTEXTUAL, "medium", "Problem/pain point section", SiloType.SERVICES),
+
+    # Libraries page links OUT
+    ("/libraries/", "/services/e-rate-application-management", "complete application management",
+     LinkType.CONTEXTUAL, "high", "Services mention", SiloType.SERVICES),
+    ("/libraries/", "/guides/what-is-e-rate/", "learn about the E-Rate program",
+     LinkType.CONTEXTUAL, "medium", "Intro section", SiloType.RESOURCES),
+
+    # Charter schools page links OUT
+    ("/charter-schools/", "/services/form-470-filing", "Form 470 filing help",
+     LinkType.CONTEXTUAL, "high", "Competitive bidding section", SiloType.SERVICES),
+    ("/charter-schools/", "/guides/e-rate-eligibility-calculator/", "calculate your discount",
+     LinkType.CONTEXTUAL, "high", "Eligibility section", SiloType.RESOURCES),
+
+    # Guide pages links OUT
+    ("/guides/what-is-e-rate/", "/services/e-rate-application-management", "professional E-Rate management",
+     LinkType.CTA, "high", "CTA section at end", SiloType.SERVICES),
+    ("/guides/what-is-e-rate/", "/schools/", "schools eligible for E-Rate",
+     LinkType.CONTEXTUAL, "medium", "Eligibility section", SiloType.AUDIENCE),
+    ("/guides/what-is-e-rate/", "/libraries/", "libraries eligible for E-Rate",
+     LinkType.CONTEXTUAL, "medium", "Eligibility section", SiloType.AUDIENCE),
+
+    # Eligibility calculator links OUT
+    ("/guides/e-rate-eligibility-calculator/", "/services/form-471-filing", "start your Form 471 application",
+     LinkType.CTA, "high", "Post-calculation CTA", SiloType.SERVICES),
+
+    # Deadlines page links OUT
+    ("/guides/e-rate-deadlines-2026/", "/services/form-470-filing", "Form 470 filing service",
+     LinkType.CONTEXTUAL, "high", "October deadline section", SiloType.SERVICES),
+    ("/guides/e-rate-deadlines-2026/", "/services/form-471-filing", "Form 471 filing experts",
+     LinkType.CONTEXTUAL, "high", "January deadline section", SiloType.SERVICES),
+
+    # Service pages inter-linking (process flow)
+    ("/services/form-470-filing", "/services/form-471-filing", "Form 471 filing",
+     LinkType.CONTEXTUAL, "high", "Process continuation section", SiloType.SERVICES),
+    ("/services/form-471-filing", "/services/pia-review-support", "PIA review preparation",
+     LinkType.CONTEXTUAL, "high", "What happens next section", SiloType.SERVICES),
+    ("/services/pia-review-support", "/services/e-rate-appeals", "appeal support if needed",
+     LinkType.CONTEXTUAL, "medium", "If issues arise section", SiloType.SERVICES),
+
+    # Appeals page context link
+    ("/services/e-rate-appeals", "/guides/what-is-e-rate/", "E-Rate program requirements",
+     LinkType.CONTEXTUAL, "low", "Context for why denials happen", SiloType.RESOURCES),
+)
 
 
 class LinkArchitect:
@@ -67,284 +178,152 @@ class LinkArchitect:
     
     def __init__(self):
         self.domain = "erateapp.com"
-        self.silos: List[SiloStructure] = []
-        self.all_links: List[InternalLink] = []
-        self._initialize_silo_structure()
-        self._initialize_link_map()
+        # silos, all_links and the link indexes are cached properties, built
+        # on first use so short-lived agents only pay for what they touch
+        self._audit_cache: Optional[Dict] = None
+        self._link_map_payload: Optional[Dict] = None
+        self._page_links_cache: Dict[str, Dict] = {}
+        self._graph: Optional[LinkGraph] = None
+        self._silo_payload: Optional[Dict] = None
+        
+        # Bound once so execute_task does not rebuild the table per dispatch;
+        # also used by the orchestrator's router
+        self.TASKS: Dict[str, Callable[[Dict], Dict]] = {
+            "get_silo_structure": self.get_silo_structure,
+            "get_link_map": self.get_link_map,
+            "audit_internal_links": self.audit_internal_links,
+            "get_page_links": self.get_page_links,
+            "find_orphan_pages": self.find_orphan_pages,
+            "get_anchor_recommendations": self.get_anchor_recommendations,
+            "compute_link_equity": self.compute_link_equity
+        }
     
-    def _initialize_silo_structure(self):
+    @cached_property
+    def silos(self) -> List[SiloStructure]:
         """Initialize the three main content silos."""
-        self.silos = [
+        return [
             SiloStructure(
                 name="Services Silo",
                 silo_type=SiloType.SERVICES,
                 hub_page="/services/",
-                spoke_pages=[
+                spoke_pages=(
                     "/services/e-rate-application-management",
                     "/services/e-rate-appeals",
                     "/services/form-470-filing",
                     "/services/form-471-filing",
                     "/services/pia-review-support"
-                ],
+                ),
                 internal_links=[]
             ),
             SiloStructure(
                 name="Audience Silo",
                 silo_type=SiloType.AUDIENCE,
                 hub_page="/",
-                spoke_pages=[
+                spoke_pages=(
                     "/schools/",
                     "/libraries/",
                     "/charter-schools/"
-                ],
+                ),
                 internal_links=[]
             ),
             SiloStructure(
                 name="Resources Silo",
                 silo_type=SiloType.RESOURCES,
                 hub_page="/guides/",
-                spoke_pages=[
+                spoke_pages=(
                     "/guides/what-is-e-rate/",
                     "/guides/e-rate-eligibility-calculator/",
                     "/guides/e-rate-deadlines-2026/"
-                ],
+                ),
                 internal_links=[]
             ),
             SiloStructure(
                 name="Blog Silo",
                 silo_type=SiloType.BLOG,
                 hub_page="/blog/",
-                spoke_pages=[
+                spoke_pages=(
                     "/blog/common-e-rate-mistakes/",
                     "/blog/fy2026-e-rate-deadlines/",
                     "/blog/calculate-e-rate-discount/",
                     "/blog/e-rate-charter-schools/",
                     "/blog/e-rate-application-denied/",
                     "/blog/e-rate-category-1-vs-category-2/"
-                ],
+                ),
                 internal_links=[]
             )
         ]
     
-    def _initialize_link_map(self):
+    @cached_property
+    def all_links(self) -> List[InternalLink]:
         """Initialize the complete internal link map."""
-        self.all_links = [
-            # Homepage links OUT
-            InternalLink(
-                source_url="/",
-                destination_url="/services/e-rate-appeals",
-                anchor_text="E-Rate appeal services",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Services section or problem section",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/",
-                destination_url="/schools/",
-                anchor_text="e-rate for schools",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Hero section or audience selector",
-                silo=SiloType.AUDIENCE
-            ),
-            InternalLink(
-                source_url="/",
-                destination_url="/libraries/",
-                anchor_text="e-rate for libraries",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Audience selector section",
-                silo=SiloType.AUDIENCE
-            ),
-            InternalLink(
-                source_url="/",
-                destination_url="/guides/what-is-e-rate/",
-                anchor_text="what is E-Rate",
-                link_type=LinkType.CONTEXTUAL,
-                priority="medium",
-                context="FAQ or educational section",
-                silo=SiloType.RESOURCES
-            ),
-            InternalLink(
-                source_url="/",
-                destination_url="/guides/e-rate-deadlines-2026/",
-                anchor_text="2026 E-Rate deadlines",
-                link_type=LinkType.CTA,
-                priority="high",
-                context="Urgency banner",
-                silo=SiloType.RESOURCES
-            ),
-            
-            # Schools page links OUT
-            InternalLink(
-                source_url="/schools/",
-                destination_url="/services/form-471-filing",
-                anchor_text="Form 471 filing assistance",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Application process section",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/schools/",
-                destination_url="/guides/e-rate-eligibility-calculator/",
-                anchor_text="check your discount rate",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Eligibility section",
-                silo=SiloType.RESOURCES
-            ),
-            InternalLink(
-                source_url="/schools/",
-                destination_url="/services/e-rate-appeals",
-                anchor_text="appeal denied funding",
-                link_type=LinkType.CONTEXTUAL,
-                priority="medium",
-                context="Problem/pain point section",
-                silo=SiloType.SERVICES
-            ),
-            
-            # Libraries page links OUT
-            InternalLink(
-                source_url="/libraries/",
-                destination_url="/services/e-rate-application-management",
-                anchor_text="complete application management",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Services mention",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/libraries/",
-                destination_url="/guides/what-is-e-rate/",
-                anchor_text="learn about the E-Rate program",
-                link_type=LinkType.CONTEXTUAL,
-                priority="medium",
-                context="Intro section",
-                silo=SiloType.RESOURCES
-            ),
-            
-            # Charter schools page links OUT
-            InternalLink(
-                source_url="/charter-schools/",
-                destination_url="/services/form-470-filing",
-                anchor_text="Form 470 filing help",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Competitive bidding section",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/charter-schools/",
-                destination_url="/guides/e-rate-eligibility-calculator/",
-                anchor_text="calculate your discount",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Eligibility section",
-                silo=SiloType.RESOURCES
-            ),
-            
-            # Guide pages links OUT
-            InternalLink(
-                source_url="/guides/what-is-e-rate/",
-                destination_url="/services/e-rate-application-management",
-                anchor_text="professional E-Rate management",
-                link_type=LinkType.CTA,
-                priority="high",
-                context="CTA section at end",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/guides/what-is-e-rate/",
-                destination_url="/schools/",
-                anchor_text="schools eligible for E-Rate",
-                link_type=LinkType.CONTEXTUAL,
-                priority="medium",
-                context="Eligibility section",
-                silo=SiloType.AUDIENCE
-            ),
-            InternalLink(
-                source_url="/guides/what-is-e-rate/",
-                destination_url="/libraries/",
-                anchor_text="libraries eligible for E-Rate",
-                link_type=LinkType.CONTEXTUAL,
-                priority="medium",
-                context="Eligibility section",
-                silo=SiloType.AUDIENCE
-            ),
-            
-            # Eligibility calculator links OUT
-            InternalLink(
-                source_url="/guides/e-rate-eligibility-calculator/",
-                destination_url="/services/form-471-filing",
-                anchor_text="start your Form 471 application",
-                link_type=LinkType.CTA,
-                priority="high",
-                context="Post-calculation CTA",
-                silo=SiloType.SERVICES
-            ),
-            
-            # Deadlines page links OUT
-            InternalLink(
-                source_url="/guides/e-rate-deadlines-2026/",
-                destination_url="/services/form-470-filing",
-                anchor_text="Form 470 filing service",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="October deadline section",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/guides/e-rate-deadlines-2026/",
-                destination_url="/services/form-471-filing",
-                anchor_text="Form 471 filing experts",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="January deadline section",
-                silo=SiloType.SERVICES
-            ),
-            
-            # Service pages inter-linking (process flow)
-            InternalLink(
-                source_url="/services/form-470-filing",
-                destination_url="/services/form-471-filing",
-                anchor_text="Form 471 filing",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="Process continuation section",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/services/form-471-filing",
-                destination_url="/services/pia-review-support",
-                anchor_text="PIA review preparation",
-                link_type=LinkType.CONTEXTUAL,
-                priority="high",
-                context="What happens next section",
-                silo=SiloType.SERVICES
-            ),
-            InternalLink(
-                source_url="/services/pia-review-support",
-                destination_url="/services/e-rate-appeals",
-                anchor_text="appeal support if needed",
-                link_type=LinkType.CONTEXTUAL,
-                priority="medium",
-                context="If issues arise section",
-                silo=SiloType.SERVICES
-            ),
-            
-            # Appeals page context link
-            InternalLink(
-                source_url="/services/e-rate-appeals",
-                destination_url="/guides/what-is-e-rate/",
-                anchor_text="E-Rate program requirements",
-                link_type=LinkType.CONTEXTUAL,
-                priority="low",
-                context="Context for why denials happen",
-                silo=SiloType.RESOURCES
-            ),
-        ]
+        return [InternalLink(*row) for row in _LINK_ROWS]
+    
+    @cached_property
+    def _by_source(self) -> Dict[str, List[InternalLink]]:
+        by_source: Dict[str, List[InternalLink]] = defaultdict(list)
+        for link in self.all_links:
+            by_source[link.source_url].append(link)
+        return by_source
+    
+    @cached_property
+    def _by_destination(self) -> Dict[str, List[InternalLink]]:
+        by_destination: Dict[str, List[InternalLink]] = defaultdict(list)
+        for link in self.all_links:
+            by_destination[link.destination_url].append(link)
+        return by_destination
+    
+    @cached_property
+    def _anchors_by_destination(self) -> Dict[str, List[str]]:
+        return {
+            destination: [l.anchor_text for l in links]
+            for destination, links in self._by_destination.items()
+        }
+    
+    @cached_property
+    def _priority_counts(self) -> Counter:
+        counts = Counter(dict.fromkeys(_LINK_PRIORITIES, 0))
+        counts.update(link.priority for link in self.all_links)
+        return counts
+    
+    @cached_property
+    def _all_pages(self) -> FrozenSet[str]:
+        return frozenset(chain.from_iterable(
+            (silo.hub_page, *silo.spoke_pages) for silo in self.silos
+        ))
+    
+    @cached_property
+    def _sources(self) -> FrozenSet[str]:
+        return frozenset(self._by_source)
+    
+    @cached_property
+    def _destinations(self) -> FrozenSet[str]:
+        return frozenset(self._by_destination)
+    
+    def _link_graph(self) -> LinkGraph:
+        """Build (once per link map) the CSR graph over silo pages and link endpoints."""
+        if self._graph is not None:
+            return self._graph
+        
+        url_to_id: Dict[str, int] = {}
+        for url in chain(
+            chain.from_iterable((silo.hub_page, *silo.spoke_pages) for silo in self.silos),
+            chain.from_iterable((l.source_url, l.destination_url) for l in self.all_links)
+        ):
+            url_to_id.setdefault(url, len(url_to_id))
+        urls = tuple(url_to_id)
+        
+        anchor_ids: Dict[str, int] = {}
+        indptr = array("i", [0])
+        indices = array("i")
+        anchor_idx = array("i")
+        for url in urls:
+            for link in self._by_source.get(url, ()):
+                indices.append(url_to_id[link.destination_url])
+                anchor_idx.append(anchor_ids.setdefault(link.anchor_text, len(anchor_ids)))
+            indptr.append(len(indices))
+        
+        self._graph = LinkGraph(urls, url_to_id, indptr, indices, anchor_idx, tuple(anchor_ids))
+        return self._graph
     
     def execute_task(self, task: str, context: Dict) -> Dict:
         """
@@ -357,30 +336,24 @@ class LinkArchitect:
         Returns:
             Dict containing task results
         """
-        task_handlers = {
-            "get_silo_structure": self.get_silo_structure,
-            "get_link_map": self.get_link_map,
-            "audit_internal_links": self.audit_internal_links,
-            "get_page_links": self.get_page_links,
-            "find_orphan_pages": self.find_orphan_pages,
-            "get_anchor_recommendations": self.get_anchor_recommendations
-        }
-        
-        handler = task_handlers.get(task)
+        handler = self.TASKS.get(task)
         if handler:
             return handler(context)
         else:
             return {"error": f"Unknown task: {task}"}
     
     def get_silo_structure(self, context: Dict) -> Dict:
-        """Return the complete silo structure."""
-        return {
+        """Return the complete silo structure (built once; treat as read-only)."""
+        if self._silo_payload is not None:
+            return self._silo_payload
+        
+        self._silo_payload = {
             "silos": [
                 {
                     "name": silo.name,
                     "type": silo.silo_type.value,
                     "hub_page": silo.hub_page,
-                    "spoke_pages": silo.spoke_pages,
+                    "spoke_pages": list(silo.spoke_pages),
                     "total_pages": len(silo.spoke_pages) + 1
                 }
                 for silo in self.silos
@@ -388,51 +361,55 @@ class LinkArchitect:
             "total_silos": len(self.silos),
             "total_pages": sum(len(s.spoke_pages) + 1 for s in self.silos)
         }
+        return self._silo_payload
     
     def get_link_map(self, context: Dict) -> Dict:
-        """Return the complete internal link map."""
-        return {
-            "links": [
-                {
-                    "source": link.source_url,
-                    "destination": link.destination_url,
-                    "anchor_text": link.anchor_text,
-                    "type": link.link_type.value,
-                    "priority": link.priority,
-                    "context": link.context,
-                    "silo": link.silo.value
-                }
-                for link in self.all_links
-            ],
+        """Return the complete internal link map (built once; treat as read-only)."""
+        if self._link_map_payload is not None:
+            return self._link_map_payload
+        
+        self._link_map_payload = {
+            "links": list(self.stream_links()),
             "total_links": len(self.all_links),
-            "by_priority": {
-                "critical": len([l for l in self.all_links if l.priority == "critical"]),
-                "high": len([l for l in self.all_links if l.priority == "high"]),
-                "medium": len([l for l in self.all_links if l.priority == "medium"]),
-                "low": len([l for l in self.all_links if l.priority == "low"])
-            }
+            "by_priority": dict(self._priority_counts)
         }
+        return self._link_map_payload
+    
+    def stream_links(self) -> Iterator[Dict]:
+        """
+        Yield the link map one serialized link at a time.
+        
+        Use this instead of get_link_map when forwarding links downstream
+        (e.g. as NDJSON) without materializing the whole list.
+        """
+        for link in self.all_links:
+            yield {
+                "source": link.source_url,
+                "destination": link.destination_url,
+                "anchor_text": link.anchor_text,
+                "type": link.link_type.value,
+                "priority": link.priority,
+                "context": link.context,
+                "silo": link.silo.value
+            }
     
     def audit_internal_links(self, context: Dict) -> Dict:
-        """Audit the internal link structure for issues."""
-        all_pages: Set[str] = set()
-        pages_with_incoming: Set[str] = set()
-        pages_with_outgoing: Set[str] = set()
+        """
+        Audit the internal link structure for issues.
         
-        # Collect all pages
-        for silo in self.silos:
-            all_pages.add(silo.hub_page)
-            all_pages.update(silo.spoke_pages)
+        The result is cached until the link map changes; treat it as read-only.
+        """
+        if self._audit_cache is not None:
+            return self._audit_cache
         
-        # Track incoming/outgoing links
-        for link in self.all_links:
-            pages_with_outgoing.add(link.source_url)
-            pages_with_incoming.add(link.destination_url)
+        all_pages = self._all_pages
+        orphan_pages = all_pages - self._destinations
+        dead_end_pages = all_pages - self._sources
         
-        orphan_pages = all_pages - pages_with_incoming
-        dead_end_pages = all_pages - pages_with_outgoing
+        recommendations = [f"Add incoming links to: {page}" for page in orphan_pages]
+        recommendations.extend(f"Add outgoing links from: {page}" for page in dead_end_pages)
         
-        return {
+        self._audit_cache = {
             "total_pages": len(all_pages),
             "total_links": len(self.all_links),
             "average_links_per_page": round(len(self.all_links) / len(all_pages), 2) if all_pages else 0,
@@ -442,21 +419,26 @@ class LinkArchitect:
                 "orphan_count": len(orphan_pages),
                 "dead_end_count": len(dead_end_pages)
             },
-            "recommendations": [
-                f"Add incoming links to: {page}" for page in orphan_pages
-            ] + [
-                f"Add outgoing links from: {page}" for page in dead_end_pages
-            ]
+            "recommendations": recommendations
         }
+        return self._audit_cache
     
     def get_page_links(self, context: Dict) -> Dict:
-        """Get all links for a specific page."""
+        """
+        Get all links for a specific page.
+        
+        Payloads for linked pages are cached until the link map changes;
+        treat them as read-only.
+        """
         page_url = context.get("page_url", "/")
+        cached = self._page_links_cache.get(page_url)
+        if cached is not None:
+            return cached
         
-        incoming = [l for l in self.all_links if l.destination_url == page_url]
-        outgoing = [l for l in self.all_links if l.source_url == page_url]
+        incoming = self._by_destination.get(page_url, [])
+        outgoing = self._by_source.get(page_url, [])
         
-        return {
+        payload = {
             "page": page_url,
             "incoming_links": [
                 {
@@ -478,47 +460,79 @@ class LinkArchitect:
             "incoming_count": len(incoming),
             "outgoing_count": len(outgoing)
         }
+        # Only cache known pages so arbitrary crawl URLs cannot grow the cache
+        if incoming or outgoing:
+            self._page_links_cache[page_url] = payload
+        return payload
     
     def find_orphan_pages(self, context: Dict) -> Dict:
         """Find pages without incoming internal links."""
-        audit = self.audit_internal_links(context)
+        orphans = list(self._all_pages - self._destinations)
         return {
-            "orphan_pages": audit["orphan_pages"],
-            "count": audit["issues"]["orphan_count"],
+            "orphan_pages": orphans,
+            "count": len(orphans),
             "fix_recommendations": [
                 {
                     "page": page,
                     "suggested_source": "/",  # Link from homepage as fallback
-                    "suggested_anchor": page.strip('/').split('/')[-1].replace('-', ' ').title()
+                    "suggested_anchor": page.strip('/').rsplit('/', 1)[-1].replace('-', ' ').title()
                 }
-                for page in audit["orphan_pages"]
+                for page in orphans
             ]
         }
     
+    def compute_link_equity(self, context: Dict) -> Dict:
+        """
+        Estimate link equity per page with PageRank over the CSR link graph.
+        
+        Context:
+            damping: Damping factor (default 0.85)
+            iterations: Power-iteration steps (default 50)
+        """
+        damping = context.get("damping", 0.85)
+        iterations = context.get("iterations", 50)
+        graph = self._link_graph()
+        indptr, indices = graph.indptr, graph.indices
+        n = len(graph.urls)
+        if not n:
+            return {"link_equity": {}, "iterations": 0}
+        
+        ranks = [1.0 / n] * n
+        for _ in range(iterations):
+            # Dead-end pages spread their rank evenly across the site
+            dangling = sum(ranks[i] for i in range(n) if indptr[i] == indptr[i + 1])
+            base = (1.0 - damping) / n + damping * dangling / n
+            new_ranks = [base] * n
+            for i in range(n):
+                start, end = indptr[i], indptr[i + 1]
+                if start == end:
+                    continue
+                share = damping * ranks[i] / (end - start)
+                for k in range(start, end):
+                    new_ranks[indices[k]] += share
+            ranks = new_ranks
+        
+        order = sorted(range(n), key=ranks.__getitem__, reverse=True)
+        return {
+            "link_equity": {graph.urls[i]: round(ranks[i], 4) for i in order},
+            "iterations": iterations
+        }
+    
     def get_anchor_recommendations(self, context: Dict) -> Dict:
         """Get anchor text recommendations for a destination URL."""
         destination = context.get("destination_url")
         
-        existing_anchors = [
-            l.anchor_text for l in self.all_links 
-            if l.destination_url == destination
-        ]
+        existing_anchors = list(self._anchors_by_destination.get(destination, ()))
         
         # Generate alternative anchors based on URL
         url_parts = destination.strip('/').split('/')
         page_name = url_parts[-1] if url_parts else "home"
         
         alternatives = []
-        if "form-470" in page_name:
-            alternatives = ["Form 470 help", "470 filing service", "competitive bidding assistance"]
-        elif "form-471" in page_name:
-            alternatives = ["Form 471 assistance", "471 application help", "form 471 experts"]
-        elif "appeals" in page_name:
-            alternatives = ["E-Rate appeal help", "funding denial appeal", "USAC appeal service"]
-        elif "schools" in page_name:
-            alternatives = ["school E-Rate funding", "K-12 E-Rate", "school technology grants"]
-        elif "libraries" in page_name:
-            alternatives = ["library E-Rate", "public library funding", "library broadband grants"]
+        for token, token_alternatives in _ANCHOR_ALTERNATIVES.items():
+            if token in page_name:
+                alternatives = list(token_alternatives)
+                break
         
         return {
             "destination": destination,
@@ -559,3 +573,19 @@ if __name__ == "__main__":
     print(f"  Outgoing: {home_links['outgoing_count']}")
     for link in home_links["outgoing_links"]:
         print(f"    → {link['to']} (anchor: '{link['anchor_text']}')")
+    
+    # Per-call cost of the cached lookups (rerun after changes to spot regressions)
+    print("\n\nCall Timings (warm):")
+    for task, task_context in (
+        ("audit_internal_links", {}),
+        ("find_orphan_pages", {}),
+        ("get_page_links", {"page_url": "/"}),
+        ("get_anchor_recommendations", {"destination_url": "/schools/"}),
+        ("get_link_map", {})
+    ):
+        runs = 1000
+        start = time.perf_counter_ns()
+        for _ in range(runs):
+            architect.execute_task(task, task_context)
+        elapsed_us = (time.perf_counter_ns() - start) / runs / 1000
+        print(f"  {task}: {elapsed_us:.2f} µs/call")
@@ -26,36 +26,54 @@ Available MCP Tools:
     - mcp_memory_* (Persistent entity/relation storage)
 """
 
+import asyncio
+import functools
 import json
+import operator
 import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from functools import cached_property
+from typing import List, Dict, Optional, Any, Callable, Iterator, Tuple
 from enum import Enum
 from datetime import datetime
 
+from seo_specialist import SEOSpecialist
+from content_strategist import ContentStrategist
+from link_architect import LinkArchitect
+from blog_expert import BlogExpert
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
 
 class AgentRole(Enum):
     ORCHESTRATOR = "orchestrator"
     SEO_SPECIALIST = "seo_specialist"
     CONTENT_STRATEGIST = "content_strategist"
     LINK_ARCHITECT = "link_architect"
+    BLOG_EXPERT = "blog_expert"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Page:
     """Represents a page in the SEO strategy."""
     url: str
     title_tag: str
     h1: str
     primary_keyword: str
-    secondary_keywords: List[str]
+    secondary_keywords: Tuple[str, ...]
     silo: str
     meta_description: Optional[str] = None
-    internal_links_in: List[str] = field(default_factory=list)
-    internal_links_out: List[str] = field(default_factory=list)
+    internal_links_in: Tuple[str, ...] = ()
+    internal_links_out: Tuple[str, ...] = ()
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InternalLink:
     """Represents an internal link with anchor text."""
     source_url: str
@@ -69,10 +87,335 @@ class InternalLink:
 class SEOStrategy:
     """Complete SEO strategy container."""
     domain: str
-    pages: List[Page]
-    internal_links: List[InternalLink]
+    pages: Tuple[Page, ...]
+    internal_links: Tuple[InternalLink, ...]
     content_calendar: Dict[str, Any]
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: Optional[str] = None  # ISO timestamp; defaults to now
+    # Adjacency indexes over internal_links (duplicates dropped), for
+    # outbound/inbound link queries without scanning the whole map
+    by_source: Dict[str, List[InternalLink]] = field(init=False, repr=False, compare=False)
+    by_destination: Dict[str, List[InternalLink]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now().isoformat()
+        self.by_source = defaultdict(list)
+        self.by_destination = defaultdict(list)
+        for link in dict.fromkeys(self.internal_links):
+            self.by_source[link.source_url].append(link)
+            self.by_destination[link.destination_url].append(link)
+
+
+_SUBAGENT_CLASSES: Dict[AgentRole, type] = {
+    AgentRole.SEO_SPECIALIST: SEOSpecialist,
+    AgentRole.CONTENT_STRATEGIST: ContentStrategist,
+    AgentRole.LINK_ARCHITECT: LinkArchitect,
+    AgentRole.BLOG_EXPERT: BlogExpert
+}
+
+
+@functools.cache
+def _load_config_cached(config_file: str) -> Dict:
+    """Parse a config file once per process; the returned dict is shared (read-only)."""
+    if not os.path.exists(config_file):
+        return {}
+    with open(config_file, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# =========================================================================
+# STATIC STRATEGY DATA
+# =========================================================================
+# The planned pages, link map and calendar are fixed, so they are built once
+# at import and shared by every strategy. Treat them as read-only.
+
+EXISTING_PAGES: Tuple[str, ...] = (
+    "/",
+    "/index.html",
+    "/index2.html", 
+    "/index3.html"
+)
+
+PAGES: Tuple[Page, ...] = (
+    Page(
+        url="/",
+        title_tag="SkyRate Services for Schools | 98% Approval Rate",
+        h1="SkyRate Services That Help Schools Secure Maximum Funding",
+        primary_keyword="SkyRate services for schools",
+        secondary_keywords=("e-rate application help", "school technology funding consultant"),
+        silo="Main Conversion Hub",
+        meta_description="Expert E-Rate consulting with 98% approval rate. We've secured $50M+ for 500+ schools & libraries. Get professional Form 470 & 471 help. Free consultation."
+    ),
+    Page(
+        url="/e-rate-application-help",
+        title_tag="E-Rate Application Assistance | Expert Form Filing Help",
+        h1="Get Expert E-Rate Application Assistance for Your School or Library",
+        primary_keyword="e-rate application assistance",
+        secondary_keywords=("help filing e-rate forms", "e-rate paperwork service"),
+        silo="Application Services",
+        meta_description="Professional E-Rate application assistance from certified consultants. We handle Form 470, Form 471, and all paperwork. 98% first-time approval rate."
+    ),
+    Page(
+        url="/form-470",
+        title_tag="E-Rate Form 470 Help | Competitive Bidding Experts",
+        h1="Professional E-Rate Form 470 Help: Start Your Application Right",
+        primary_keyword="e-rate form 470 help",
+        secondary_keywords=("how to file form 470", "form 470 consultant"),
+        silo="Application Services",
+        meta_description="Expert Form 470 filing assistance for schools and libraries. Proper competitive bidding setup, vendor evaluation, and compliance guidance."
+    ),
+    Page(
+        url="/form-471",
+        title_tag="Form 471 Filing Service | E-Rate Deadline Support 2026",
+        h1="E-Rate Form 471 Filing Service: Meet Deadlines With Confidence",
+        primary_keyword="e-rate form 471 filing service",
+        secondary_keywords=("form 471 deadline 2026", "help with form 471 errors"),
+        silo="Application Services",
+        meta_description="Meet your Form 471 deadline with expert support. We handle the entire filing process, PIA reviews, and ensure maximum funding approval."
+    ),
+    Page(
+        url="/appeals",
+        title_tag="E-Rate Appeal Help | USAC & FCC Funding Recovery",
+        h1="E-Rate Appeal Help: We Recover Denied Funding for Schools",
+        primary_keyword="e-rate appeal help",
+        secondary_keywords=("USAC appeal process", "e-rate funding denied appeal"),
+        silo="Appeals & Recovery",
+        meta_description="Denied E-Rate funding? Our appeal specialists have won hundreds of USAC and FCC appeals. We recover funding that others can't."
+    ),
+    Page(
+        url="/charter-schools",
+        title_tag="E-Rate for Charter Schools | Technology Funding Experts",
+        h1="E-Rate for Charter Schools: Maximize Your Technology Funding",
+        primary_keyword="e-rate for charter schools",
+        secondary_keywords=("charter school technology funding", "charter e-rate eligibility"),
+        silo="Audience Segments",
+        meta_description="Specialized E-Rate consulting for charter schools. Navigate eligibility requirements, maximize Category 1 & 2 funding, and avoid common pitfalls."
+    ),
+    Page(
+        url="/private-schools",
+        title_tag="E-Rate Consultant for Private Schools | Expert Guidance",
+        h1="E-Rate Consultant for Private Schools: Full Eligibility Support",
+        primary_keyword="e-rate consultant for private schools",
+        secondary_keywords=("private school technology grants", "e-rate for religious schools"),
+        silo="Audience Segments",
+        meta_description="E-Rate consulting for private and religious schools. We verify eligibility, maximize discounts up to 90%, and handle all compliance requirements."
+    ),
+    Page(
+        url="/library-e-rate",
+        title_tag="SkyRate for Libraries | Maximize Discounts",
+        h1="SkyRate for Libraries: Secure Your Technology Funding",
+        primary_keyword="SkyRate for libraries",
+        secondary_keywords=("library technology funding", "public library e-rate application"),
+        silo="Audience Segments",
+        meta_description="Expert E-Rate consulting for public and private libraries. Maximize your technology discounts with our 25+ years of library E-Rate experience."
+    ),
+    Page(
+        url="/case-studies",
+        title_tag="E-Rate Success Stories | Real Schools, Real Funding Wins",
+        h1="E-Rate Success Stories: See How We've Helped Schools Win Funding",
+        primary_keyword="e-rate success stories",
+        secondary_keywords=("e-rate funding examples", "schools that won e-rate appeals"),
+        silo="Social Proof",
+        meta_description="Real E-Rate success stories from schools and libraries. See how we've recovered denied funding, maximized approvals, and secured millions in technology discounts."
+    ),
+    Page(
+        url="/faq",
+        title_tag="E-Rate Eligibility Requirements | FAQ & Answers",
+        h1="E-Rate Eligibility Requirements: Frequently Asked Questions",
+        primary_keyword="e-rate eligibility requirements",
+        secondary_keywords=("how much e-rate funding can I get", "e-rate discount percentage"),
+        silo="Educational Content",
+        meta_description="Get answers to common E-Rate questions. Learn about eligibility, discount rates, deadlines, and what services are covered by the E-Rate program."
+    )
+)
+
+INTERNAL_LINKS: Tuple[InternalLink, ...] = (
+    # Homepage outbound links
+    InternalLink("/", "/e-rate-application-help", "E-Rate application services", "Within services section", "high"),
+    InternalLink("/", "/appeals", "E-Rate appeals and funding recovery", "Within services section", "high"),
+    InternalLink("/", "/charter-schools", "charter school E-Rate funding", "Within audience targeting", "medium"),
+    InternalLink("/", "/faq", "frequently asked E-Rate questions", "Footer or resources area", "medium"),
+    
+    # Application silo links
+    InternalLink("/e-rate-application-help", "/form-470", "Form 470 filing help", "Process step 1", "high"),
+    InternalLink("/e-rate-application-help", "/form-471", "Form 471 submission service", "Process step 2", "high"),
+    InternalLink("/form-470", "/form-471", "Form 471 filing support", "Next steps section", "high"),
+    InternalLink("/form-471", "/appeals", "appeal a denied E-Rate application", "What if denied section", "high"),
+    
+    # Audience segment links
+    InternalLink("/charter-schools", "/e-rate-application-help", "full E-Rate application assistance", "CTA section", "high"),
+    InternalLink("/private-schools", "/faq", "E-Rate eligibility requirements", "Eligibility questions section", "medium"),
+    InternalLink("/library-e-rate", "/case-studies", "library E-Rate success stories", "Results section", "medium"),
+    
+    # Social proof links
+    InternalLink("/appeals", "/case-studies", "real appeal victories", "Proof section", "high"),
+    InternalLink("/case-studies", "/", "E-Rate consulting services", "CTA to convert", "high"),
+    
+    # FAQ educational links
+    InternalLink("/faq", "/appeals", "E-Rate appeal help", "Denied funding FAQ", "medium"),
+    InternalLink("/faq", "/e-rate-application-help", "professional application assistance", "How to apply FAQ", "medium")
+)
+
+CONTENT_CALENDAR: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    "q1_2026": (
+        {
+            "title": "E-Rate Deadlines 2026: Complete Calendar of Important Dates",
+            "url": "/blog/e-rate-deadlines-2026",
+            "primary_keyword": "e-rate deadline 2026",
+            "publish_date": "2026-01-15",
+            "priority": "high",
+            "links_to": ("/form-471", "/e-rate-application-help")
+        },
+        {
+            "title": "What is the E-Rate Program? A Complete Beginner's Guide",
+            "url": "/blog/e-rate-beginners-guide",
+            "primary_keyword": "what is e-rate program",
+            "publish_date": "2026-02-01",
+            "priority": "high",
+            "links_to": ("/", "/e-rate-application-help")
+        },
+        {
+            "title": "5 Common E-Rate Application Mistakes That Cost Schools Thousands",
+            "url": "/blog/common-e-rate-mistakes",
+            "primary_keyword": "e-rate application mistakes",
+            "publish_date": "2026-02-15",
+            "priority": "medium",
+            "links_to": ("/appeals", "/e-rate-application-help")
+        }
+    ),
+    "q2_2026": (
+        {
+            "title": "E-Rate Category 1 vs Category 2: What's the Difference?",
+            "url": "/blog/category-1-vs-category-2",
+            "primary_keyword": "e-rate category 1 category 2",
+            "publish_date": "2026-04-01",
+            "priority": "medium",
+            "links_to": ("/faq", "/e-rate-application-help")
+        },
+        {
+            "title": "How to Win an E-Rate Appeal: Expert Strategies",
+            "url": "/blog/how-to-win-e-rate-appeal",
+            "primary_keyword": "how to win e-rate appeal",
+            "publish_date": "2026-05-01",
+            "priority": "high",
+            "links_to": ("/appeals", "/case-studies")
+        }
+    )
+}
+
+
+# =========================================================================
+# REPORT TEMPLATES
+# =========================================================================
+# Static Markdown for generate_seo_report; only the tables, calendar and
+# timestamp are filled in per report.
+
+_REPORT_HEADER = """# E-Rate App SEO Strategy Report
+Generated: {date}
+
+## Executive Summary
+This report outlines the complete SEO strategy for erateapp.com, including keyword mapping, 
+title/H1 optimization, and internal linking architecture.
+
+---
+
+## Phase 1: Predictive Intent & Keyword Mapping
+
+### Target Audience Intent Categories
+1. **Informational**: Users researching E-Rate basics, eligibility, deadlines
+2. **Commercial Investigation**: Comparing DIY vs consultant approaches
+3. **Transactional**: Ready to hire an E-Rate consultant
+
+### Primary Keyword Focus
+- Avoiding head terms like "E-Rate" (dominated by USAC)
+- Targeting "Position 8-20" long-tail opportunities
+- Focus on problem-aware and solution-seeking queries
+
+---
+
+## Phase 2: Title Tag & H1 Architecture
+
+| Planned URL | Primary Query | Optimized Title Tag | H1 Tag |
+|-------------|---------------|--------------------|---------|
+"""
+
+_REPORT_MID_SILO = """
+---
+
+## Phase 3: Semantic Internal Linking (Silo Strategy)
+
+### Silo Architecture
+
+```
+PILLAR 1: APPLICATION SERVICES (Main Conversion Hub)
+├── Homepage (/)
+├── E-Rate Application Help (/e-rate-application-help) ← Pillar Page
+│   ├── Form 470 Help (/form-470) ← Cluster Page
+│   └── Form 471 Help (/form-471) ← Cluster Page
+
+PILLAR 2: APPEALS & RECOVERY (Secondary Hub)
+├── Appeals Page (/appeals) ← Pillar Page
+└── Supporting blog content
+
+PILLAR 3: AUDIENCE SEGMENTS (Niche Targeting)
+├── Charter Schools (/charter-schools)
+├── Private Schools (/private-schools)
+└── Libraries (/library-e-rate)
+
+PILLAR 4: EDUCATIONAL CONTENT (Top-of-Funnel)
+├── FAQ (/faq)
+└── Blog posts
+```
+
+### Internal Link Action Plan
+
+| Source Page | Destination Page | Anchor Text | Priority |
+|-------------|------------------|-------------|----------|
+"""
+
+_REPORT_CALENDAR_HEADER = """
+---
+
+## Content Calendar (Q1-Q2 2026)
+
+"""
+
+_REPORT_FOOTER = """---
+
+## Implementation Priority
+
+### Immediate Actions (Week 1)
+1. Update homepage meta tags on index3.html
+2. Create /e-rate-application-help pillar page
+3. Create /appeals page
+
+### Short-term (Weeks 2-4)
+4. Create Form 470 and Form 471 pages
+5. Create audience segment pages (charter, private, library)
+6. Implement internal link structure
+
+### Medium-term (Month 2)
+7. Launch FAQ page with FAQPage schema
+8. Publish first blog posts
+9. Submit XML sitemap to Google Search Console
+
+---
+
+*Report generated by SEO Orchestrator Agent System*
+"""
+
+_PAGE_ROW = "| `{}` | {} | {} | {} |\n".format
+_LINK_ROW = "| `{0.source_url}` | `{0.destination_url}` | \"{0.anchor_text}\" | {0.priority} |\n".format
+_CALENDAR_POST = (
+    "- **{title}**\n"
+    "  - URL: `{url}`\n"
+    "  - Target Keyword: {primary_keyword}\n"
+    "  - Publish: {publish_date}\n"
+    "  - Internal Links To: {links}\n\n"
+).format
 
 
 class SEOOrchestrator:
@@ -87,22 +430,62 @@ class SEOOrchestrator:
     
     def __init__(self, config_path: str = "config.json"):
         self.config = self._load_config(config_path)
+        target_site = self.config.get("target_site", {})
+        self.domain: str = target_site.get("domain", "erateapp.com")
+        self.primary_competitors: List[str] = target_site.get("primary_competitors", [])
         self.strategy: Optional[SEOStrategy] = None
-        self.memory_entities: List[Dict] = []
+        self.memory_entities: Dict[str, Dict] = {}
         self.memory_relations: List[Dict] = []
+        self._relations_by_from: Dict[str, List[Dict]] = defaultdict(list)
+        # Sub-agents are long-lived: built on first delegation, then reused
+        self._subagents: Dict[AgentRole, Any] = {}
+        self._subagents_lock = threading.Lock()
         
     def _load_config(self, config_path: str) -> Dict:
         """Load agent configuration from JSON file."""
-        config_file = os.path.join(os.path.dirname(__file__), config_path)
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        return {}
+        config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), config_path)
+        return _load_config_cached(config_file)
     
     # =========================================================================
     # SUB-AGENT DELEGATION
     # =========================================================================
     
+    def _get_subagent(self, role: AgentRole) -> Any:
+        """Return the cached sub-agent for a role, creating it on first use."""
+        agent = self._subagents.get(role)
+        if agent is None:
+            # Audit phases delegate from worker threads; build each agent once
+            with self._subagents_lock:
+                agent = self._subagents.get(role)
+                if agent is None:
+                    agent = self._subagents[role] = _SUBAGENT_CLASSES[role]()
+        return agent
+    
+    def _dispatch(self, role: AgentRole, task: str, context: Dict) -> Dict:
+        """Run a task through the sub-agent's TASKS table."""
+        handler = self._get_subagent(role).TASKS.get(task)
+        if handler is None:
+            return {"error": f"Unknown task: {task}"}
+        return handler(context)
+    
+    @cached_property
+    def _task_router(self) -> Dict[str, Callable[[Dict], Dict]]:
+        """Task name -> handler across every sub-agent (task names must be unique)."""
+        router: Dict[str, Callable[[Dict], Dict]] = {}
+        for role in _SUBAGENT_CLASSES:
+            for task, handler in self._get_subagent(role).TASKS.items():
+                if task in router:
+                    raise ValueError(f"Task {task!r} is handled by more than one sub-agent")
+                router[task] = handler
+        return router
+    
+    def route_task(self, task: str, context: Dict) -> Dict:
+        """Run a task on whichever sub-agent handles it."""
+        handler = self._task_router.get(task)
+        if handler is None:
+            return {"error": f"Unknown task: {task}"}
+        return handler(context)
+    
     def delegate_to_seo_specialist(self, task: str, context: Dict) -> Dict:
         """
         Delegate technical SEO tasks to the SEO Specialist sub-agent.
@@ -113,9 +496,7 @@ class SEOOrchestrator:
         - Meta description writing
         - Technical SEO audits
         """
-        from seo_specialist import SEOSpecialist
-        specialist = SEOSpecialist()
-        return specialist.execute_task(task, context)
+        return self._dispatch(AgentRole.SEO_SPECIALIST, task, context)
     
     def delegate_to_content_strategist(self, task: str, context: Dict) -> Dict:
         """
@@ -127,9 +508,7 @@ class SEOOrchestrator:
         - Blog post outlines
         - Content gap analysis
         """
-        from content_strategist import ContentStrategist
-        strategist = ContentStrategist()
-        return strategist.execute_task(task, context)
+        return self._dispatch(AgentRole.CONTENT_STRATEGIST, task, context)
     
     def delegate_to_link_architect(self, task: str, context: Dict) -> Dict:
         """
@@ -141,9 +520,7 @@ class SEOOrchestrator:
         - Anchor text optimization
         - Link equity distribution
         """
-        from link_architect import LinkArchitect
-        architect = LinkArchitect()
-        return architect.execute_task(task, context)
+        return self._dispatch(AgentRole.LINK_ARCHITECT, task, context)
     
     def delegate_to_blog_expert(self, task: str, context: Dict) -> Dict:
         """
@@ -157,9 +534,7 @@ class SEOOrchestrator:
         - Content calendar (get_content_calendar)
         - Blog SEO analysis (analyze_blog_seo)
         """
-        from blog_expert import BlogExpert
-        expert = BlogExpert()
-        return expert.execute_task(task, context)
+        return self._dispatch(AgentRole.BLOG_EXPERT, task, context)
     
     # =========================================================================
     # MEMORY OPERATIONS
@@ -172,7 +547,7 @@ class SEOOrchestrator:
             "name": name,
             "observations": observations
         }
-        self.memory_entities.append(entity)
+        self.memory_entities[name] = entity
         
     def create_relation(self, from_entity: str, relation_type: str, to_entity: str) -> None:
         """Create a relation between two entities in memory."""
@@ -182,19 +557,21 @@ class SEOOrchestrator:
             "to": to_entity
         }
         self.memory_relations.append(relation)
+        self._relations_by_from[from_entity].append(relation)
         
     def query_memory(self, entity_name: str) -> Optional[Dict]:
         """Query memory for a specific entity."""
-        for entity in self.memory_entities:
-            if entity["name"] == entity_name:
-                return entity
-        return None
+        return self.memory_entities.get(entity_name)
+    
+    def query_relations(self, from_entity: str) -> List[Dict]:
+        """Query memory for all relations originating at an entity."""
+        return list(self._relations_by_from.get(from_entity, ()))
     
     # =========================================================================
     # MAIN ORCHESTRATION WORKFLOWS
     # =========================================================================
     
-    def run_full_seo_audit(self) -> Dict:
+    def run_full_seo_audit(self, now: Optional[datetime] = None) -> Dict:
         """
         Execute a complete SEO audit workflow.
         
@@ -205,46 +582,83 @@ class SEOOrchestrator:
         4. Analyze content gaps (Content Strategist)
         5. Map internal links (Link Architect)
         6. Generate recommendations
+        
+        Pass `now` to stamp a whole workflow (audit, strategy, report) with
+        one timestamp, e.g. for reproducible reports.
         """
+        domain = self.domain
         results = {
-            "timestamp": datetime.now().isoformat(),
-            "domain": self.config.get("target_site", {}).get("domain", "erateapp.com"),
+            "timestamp": (now or datetime.now()).isoformat(),
+            "domain": domain,
             "phases": {}
         }
         
-        # Phase 1: Technical SEO Audit
-        results["phases"]["technical_seo"] = self.delegate_to_seo_specialist(
-            "audit",
-            {"domain": results["domain"]}
-        )
-        
-        # Phase 2: Keyword Strategy
-        results["phases"]["keyword_strategy"] = self.delegate_to_seo_specialist(
-            "keyword_research",
-            {"industry": "SkyRate", "competitors": self.config.get("target_site", {}).get("primary_competitors", [])}
-        )
-        
-        # Phase 3: Content Analysis
-        results["phases"]["content_analysis"] = self.delegate_to_content_strategist(
-            "content_gap_analysis",
-            {"existing_pages": self._get_existing_pages()}
-        )
+        # Phases are independent delegations, so run them concurrently;
+        # the phases dict keeps phase order regardless of completion order
+        jobs = self._audit_phase_jobs(domain)
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                name: executor.submit(delegate, task, context)
+                for name, (delegate, task, context) in jobs.items()
+            }
+            results["phases"] = {name: future.result() for name, future in futures.items()}
         
-        # Phase 4: Internal Link Audit
-        results["phases"]["link_audit"] = self.delegate_to_link_architect(
-            "audit_internal_links",
-            {"domain": results["domain"]}
-        )
+        return results
+    
+    async def run_full_seo_audit_async(self, now: Optional[datetime] = None) -> Dict:
+        """Async variant of run_full_seo_audit for callers already on an event loop."""
+        domain = self.domain
+        results = {
+            "timestamp": (now or datetime.now()).isoformat(),
+            "domain": domain,
+            "phases": {}
+        }
         
-        # Phase 5: Blog Strategy
-        results["phases"]["blog_strategy"] = self.delegate_to_blog_expert(
-            "get_priority_posts",
-            {}
-        )
+        jobs = self._audit_phase_jobs(domain)
+        phase_results = await asyncio.gather(*(
+            asyncio.to_thread(delegate, task, context)
+            for delegate, task, context in jobs.values()
+        ))
+        results["phases"] = dict(zip(jobs, phase_results))
         
         return results
     
-    def execute_keyword_strategy(self) -> SEOStrategy:
+    def _audit_phase_jobs(self, domain: str) -> Dict[str, Tuple[Callable[[str, Dict], Dict], str, Dict]]:
+        """Phase name -> (delegate, task, context) for the full SEO audit."""
+        return {
+            # Phase 1: Technical SEO Audit
+            "technical_seo": (
+                self.delegate_to_seo_specialist,
+                "audit",
+                {"domain": domain}
+            ),
+            # Phase 2: Keyword Strategy
+            "keyword_strategy": (
+                self.delegate_to_seo_specialist,
+                "keyword_research",
+                {"industry": "SkyRate", "competitors": self.primary_competitors}
+            ),
+            # Phase 3: Content Analysis
+            "content_analysis": (
+                self.delegate_to_content_strategist,
+                "content_gap_analysis",
+                {"existing_pages": self._get_existing_pages()}
+            ),
+            # Phase 4: Internal Link Audit
+            "link_audit": (
+                self.delegate_to_link_architect,
+                "audit_internal_links",
+                {"domain": domain}
+            ),
+            # Phase 5: Blog Strategy
+            "blog_strategy": (
+                self.delegate_to_blog_expert,
+                "get_priority_posts",
+                {}
+            )
+        }
+    
+    def execute_keyword_strategy(self, now: Optional[datetime] = None) -> SEOStrategy:
         """
         Execute the keyword mapping strategy for all planned pages.
         
@@ -258,309 +672,68 @@ class SEOOrchestrator:
             domain="erateapp.com",
             pages=pages,
             internal_links=internal_links,
-            content_calendar=content_calendar
+            content_calendar=content_calendar,
+            created_at=now.isoformat() if now else None
         )
         
         return self.strategy
     
-    def _get_existing_pages(self) -> List[str]:
+    def _get_existing_pages(self) -> Tuple[str, ...]:
         """Get list of existing pages on the site."""
-        return [
-            "/",
-            "/index.html",
-            "/index2.html", 
-            "/index3.html"
-        ]
-    
-    def _build_page_list(self) -> List[Page]:
+        return EXISTING_PAGES
+    
+    def _build_page_list(self) -> Tuple[Page, ...]:
         """Build the complete list of optimized pages."""
-        return [
-            Page(
-                url="/",
-                title_tag="SkyRate Services for Schools | 98% Approval Rate",
-                h1="SkyRate Services That Help Schools Secure Maximum Funding",
-                primary_keyword="SkyRate services for schools",
-                secondary_keywords=["e-rate application help", "school technology funding consultant"],
-                silo="Main Conversion Hub",
-                meta_description="Expert E-Rate consulting with 98% approval rate. We've secured $50M+ for 500+ schools & libraries. Get professional Form 470 & 471 help. Free consultation."
-            ),
-            Page(
-                url="/e-rate-application-help",
-                title_tag="E-Rate Application Assistance | Expert Form Filing Help",
-                h1="Get Expert E-Rate Application Assistance for Your School or Library",
-                primary_keyword="e-rate application assistance",
-                secondary_keywords=["help filing e-rate forms", "e-rate paperwork service"],
-                silo="Application Services",
-                meta_description="Professional E-Rate application assistance from certified consultants. We handle Form 470, Form 471, and all paperwork. 98% first-time approval rate."
-            ),
-            Page(
-                url="/form-470",
-                title_tag="E-Rate Form 470 Help | Competitive Bidding Experts",
-                h1="Professional E-Rate Form 470 Help: Start Your Application Right",
-                primary_keyword="e-rate form 470 help",
-                secondary_keywords=["how to file form 470", "form 470 consultant"],
-                silo="Application Services",
-                meta_description="Expert Form 470 filing assistance for schools and libraries. Proper competitive bidding setup, vendor evaluation, and compliance guidance."
-            ),
-            Page(
-                url="/form-471",
-                title_tag="Form 471 Filing Service | E-Rate Deadline Support 2026",
-                h1="E-Rate Form 471 Filing Service: Meet Deadlines With Confidence",
-                primary_keyword="e-rate form 471 filing service",
-                secondary_keywords=["form 471 deadline 2026", "help with form 471 errors"],
-                silo="Application Services",
-                meta_description="Meet your Form 471 deadline with expert support. We handle the entire filing process, PIA reviews, and ensure maximum funding approval."
-            ),
-            Page(
-                url="/appeals",
-                title_tag="E-Rate Appeal Help | USAC & FCC Funding Recovery",
-                h1="E-Rate Appeal Help: We Recover Denied Funding for Schools",
-                primary_keyword="e-rate appeal help",
-                secondary_keywords=["USAC appeal process", "e-rate funding denied appeal"],
-                silo="Appeals & Recovery",
-                meta_description="Denied E-Rate funding? Our appeal specialists have won hundreds of USAC and FCC appeals. We recover funding that others can't."
-            ),
-            Page(
-                url="/charter-schools",
-                title_tag="E-Rate for Charter Schools | Technology Funding Experts",
-                h1="E-Rate for Charter Schools: Maximize Your Technology Funding",
-                primary_keyword="e-rate for charter schools",
-                secondary_keywords=["charter school technology funding", "charter e-rate eligibility"],
-                silo="Audience Segments",
-                meta_description="Specialized E-Rate consulting for charter schools. Navigate eligibility requirements, maximize Category 1 & 2 funding, and avoid common pitfalls."
-            ),
-            Page(
-                url="/private-schools",
-                title_tag="E-Rate Consultant for Private Schools | Expert Guidance",
-                h1="E-Rate Consultant for Private Schools: Full Eligibility Support",
-                primary_keyword="e-rate consultant for private schools",
-                secondary_keywords=["private school technology grants", "e-rate for religious schools"],
-                silo="Audience Segments",
-                meta_description="E-Rate consulting for private and religious schools. We verify eligibility, maximize discounts up to 90%, and handle all compliance requirements."
-            ),
-            Page(
-                url="/library-e-rate",
-                title_tag="SkyRate for Libraries | Maximize Discounts",
-                h1="SkyRate for Libraries: Secure Your Technology Funding",
-                primary_keyword="SkyRate for libraries",
-                secondary_keywords=["library technology funding", "public library e-rate application"],
-                silo="Audience Segments",
-                meta_description="Expert E-Rate consulting for public and private libraries. Maximize your technology discounts with our 25+ years of library E-Rate experience."
-            ),
-            Page(
-                url="/case-studies",
-                title_tag="E-Rate Success Stories | Real Schools, Real Funding Wins",
-                h1="E-Rate Success Stories: See How We've Helped Schools Win Funding",
-                primary_keyword="e-rate success stories",
-                secondary_keywords=["e-rate funding examples", "schools that won e-rate appeals"],
-                silo="Social Proof",
-                meta_description="Real E-Rate success stories from schools and libraries. See how we've recovered denied funding, maximized approvals, and secured millions in technology discounts."
-            ),
-            Page(
-                url="/faq",
-                title_tag="E-Rate Eligibility Requirements | FAQ & Answers",
-                h1="E-Rate Eligibility Requirements: Frequently Asked Questions",
-                primary_keyword="e-rate eligibility requirements",
-                secondary_keywords=["how much e-rate funding can I get", "e-rate discount percentage"],
-                silo="Educational Content",
-                meta_description="Get answers to common E-Rate questions. Learn about eligibility, discount rates, deadlines, and what services are covered by the E-Rate program."
-            )
-        ]
+        return PAGES
     
-    def _build_internal_link_map(self) -> List[InternalLink]:
+    def _build_internal_link_map(self) -> Tuple[InternalLink, ...]:
         """Build the complete internal linking map."""
-        return [
-            # Homepage outbound links
-            InternalLink("/", "/e-rate-application-help", "E-Rate application services", "Within services section", "high"),
-            InternalLink("/", "/appeals", "E-Rate appeals and funding recovery", "Within services section", "high"),
-            InternalLink("/", "/charter-schools", "charter school E-Rate funding", "Within audience targeting", "medium"),
-            InternalLink("/", "/faq", "frequently asked E-Rate questions", "Footer or resources area", "medium"),
-            
-            # Application silo links
-            InternalLink("/e-rate-application-help", "/form-470", "Form 470 filing help", "Process step 1", "high"),
-            InternalLink("/e-rate-application-help", "/form-471", "Form 471 submission service", "Process step 2", "high"),
-            InternalLink("/form-470", "/form-471", "Form 471 filing support", "Next steps section", "high"),
-            InternalLink("/form-471", "/appeals", "appeal a denied E-Rate application", "What if denied section", "high"),
-            
-            # Audience segment links
-            InternalLink("/charter-schools", "/e-rate-application-help", "full E-Rate application assistance", "CTA section", "high"),
-            InternalLink("/private-schools", "/faq", "E-Rate eligibility requirements", "Eligibility questions section", "medium"),
-            InternalLink("/library-e-rate", "/case-studies", "library E-Rate success stories", "Results section", "medium"),
-            
-            # Social proof links
-            InternalLink("/appeals", "/case-studies", "real appeal victories", "Proof section", "high"),
-            InternalLink("/case-studies", "/", "E-Rate consulting services", "CTA to convert", "high"),
-            
-            # FAQ educational links
-            InternalLink("/faq", "/appeals", "E-Rate appeal help", "Denied funding FAQ", "medium"),
-            InternalLink("/faq", "/e-rate-application-help", "professional application assistance", "How to apply FAQ", "medium")
-        ]
+        return INTERNAL_LINKS
     
     def _build_content_calendar(self) -> Dict[str, Any]:
         """Build the content calendar for blog posts."""
+        # Unlike the other tables the calendar holds mutable dicts, so each
+        # strategy gets its own copy rather than the shared constant
         return {
-            "q1_2026": [
-                {
-                    "title": "E-Rate Deadlines 2026: Complete Calendar of Important Dates",
-                    "url": "/blog/e-rate-deadlines-2026",
-                    "primary_keyword": "e-rate deadline 2026",
-                    "publish_date": "2026-01-15",
-                    "priority": "high",
-                    "links_to": ["/form-471", "/e-rate-application-help"]
-                },
-                {
-                    "title": "What is the E-Rate Program? A Complete Beginner's Guide",
-                    "url": "/blog/e-rate-beginners-guide",
-                    "primary_keyword": "what is e-rate program",
-                    "publish_date": "2026-02-01",
-                    "priority": "high",
-                    "links_to": ["/", "/e-rate-application-help"]
-                },
-                {
-                    "title": "5 Common E-Rate Application Mistakes That Cost Schools Thousands",
-                    "url": "/blog/common-e-rate-mistakes",
-                    "primary_keyword": "e-rate application mistakes",
-                    "publish_date": "2026-02-15",
-                    "priority": "medium",
-                    "links_to": ["/appeals", "/e-rate-application-help"]
-                }
-            ],
-            "q2_2026": [
-                {
-                    "title": "E-Rate Category 1 vs Category 2: What's the Difference?",
-                    "url": "/blog/category-1-vs-category-2",
-                    "primary_keyword": "e-rate category 1 category 2",
-                    "publish_date": "2026-04-01",
-                    "priority": "medium",
-                    "links_to": ["/faq", "/e-rate-application-help"]
-                },
-                {
-                    "title": "How to Win an E-Rate Appeal: Expert Strategies",
-                    "url": "/blog/how-to-win-e-rate-appeal",
-                    "primary_keyword": "how to win e-rate appeal",
-                    "publish_date": "2026-05-01",
-                    "priority": "high",
-                    "links_to": ["/appeals", "/case-studies"]
-                }
-            ]
+            quarter: [{**post, "links_to": list(post["links_to"])} for post in posts]
+            for quarter, posts in CONTENT_CALENDAR.items()
         }
     
     # =========================================================================
     # OUTPUT GENERATION
     # =========================================================================
     
-    def generate_seo_report(self) -> str:
+    def generate_seo_report(self, now: Optional[datetime] = None) -> str:
         """Generate a comprehensive SEO strategy report in Markdown."""
+        return "".join(self.iter_seo_report_chunks(now))
+    
+    def iter_seo_report_chunks(self, now: Optional[datetime] = None) -> Iterator[str]:
+        """
+        Yield the Markdown SEO report piece by piece.
+        
+        Lets callers stream the report to disk without holding it in memory.
+        """
         if not self.strategy:
-            self.execute_keyword_strategy()
-            
-        report = f"""# E-Rate App SEO Strategy Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-## Executive Summary
-This report outlines the complete SEO strategy for erateapp.com, including keyword mapping, 
-title/H1 optimization, and internal linking architecture.
-
----
-
-## Phase 1: Predictive Intent & Keyword Mapping
-
-### Target Audience Intent Categories
-1. **Informational**: Users researching E-Rate basics, eligibility, deadlines
-2. **Commercial Investigation**: Comparing DIY vs consultant approaches
-3. **Transactional**: Ready to hire an E-Rate consultant
-
-### Primary Keyword Focus
-- Avoiding head terms like "E-Rate" (dominated by USAC)
-- Targeting "Position 8-20" long-tail opportunities
-- Focus on problem-aware and solution-seeking queries
-
----
-
-## Phase 2: Title Tag & H1 Architecture
-
-| Planned URL | Primary Query | Optimized Title Tag | H1 Tag |
-|-------------|---------------|--------------------|---------|\n"""
+            self.execute_keyword_strategy(now)
         
-        for page in self.strategy.pages:
-            report += f"| `{page.url}` | {page.primary_keyword} | {page.title_tag} | {page.h1} |\n"
+        now = now or datetime.now()
+        yield _REPORT_HEADER.format(date=now.strftime('%Y-%m-%d %H:%M'))
         
-        report += """
----
-
-## Phase 3: Semantic Internal Linking (Silo Strategy)
-
-### Silo Architecture
-
-```
-PILLAR 1: APPLICATION SERVICES (Main Conversion Hub)
-├── Homepage (/)
-├── E-Rate Application Help (/e-rate-application-help) ← Pillar Page
-│   ├── Form 470 Help (/form-470) ← Cluster Page
-│   └── Form 471 Help (/form-471) ← Cluster Page
-
-PILLAR 2: APPEALS & RECOVERY (Secondary Hub)
-├── Appeals Page (/appeals) ← Pillar Page
-└── Supporting blog content
-
-PILLAR 3: AUDIENCE SEGMENTS (Niche Targeting)
-├── Charter Schools (/charter-schools)
-├── Private Schools (/private-schools)
-└── Libraries (/library-e-rate)
-
-PILLAR 4: EDUCATIONAL CONTENT (Top-of-Funnel)
-├── FAQ (/faq)
-└── Blog posts
-```
-
-### Internal Link Action Plan
-
-| Source Page | Destination Page | Anchor Text | Priority |
-|-------------|------------------|-------------|----------|\n"""
+        page_fields = operator.attrgetter("url", "primary_keyword", "title_tag", "h1")
+        for page in self.strategy.pages:
+            yield _PAGE_ROW(*page_fields(page))
         
+        yield _REPORT_MID_SILO
         for link in self.strategy.internal_links:
-            report += f"| `{link.source_url}` | `{link.destination_url}` | \"{link.anchor_text}\" | {link.priority} |\n"
+            yield _LINK_ROW(link)
         
-        report += """
----
-
-## Content Calendar (Q1-Q2 2026)
-
-"""
+        yield _REPORT_CALENDAR_HEADER
         for quarter, posts in self.strategy.content_calendar.items():
-            report += f"### {quarter.upper()}\n\n"
+            yield f"### {quarter.upper()}\n\n"
             for post in posts:
-                report += f"- **{post['title']}**\n"
-                report += f"  - URL: `{post['url']}`\n"
-                report += f"  - Target Keyword: {post['primary_keyword']}\n"
-                report += f"  - Publish: {post['publish_date']}\n"
-                report += f"  - Internal Links To: {', '.join(post['links_to'])}\n\n"
+                yield _CALENDAR_POST(links=', '.join(post['links_to']), **post)
         
-        report += """---
-
-## Implementation Priority
-
-### Immediate Actions (Week 1)
-1. Update homepage meta tags on index3.html
-2. Create /e-rate-application-help pillar page
-3. Create /appeals page
-
-### Short-term (Weeks 2-4)
-4. Create Form 470 and Form 471 pages
-5. Create audience segment pages (charter, private, library)
-6. Implement internal link structure
-
-### Medium-term (Month 2)
-7. Launch FAQ page with FAQPage schema
-8. Publish first blog posts
-9. Submit XML sitemap to Google Search Console
-
----
-
-*Report generated by SEO Orchestrator Agent System*
-"""
-        return report
-
+        yield _REPORT_FOOTER
 
 # =========================================================================
 # MAIN ENTRY POINT
@@ -568,11 +741,11 @@ PILLAR 4: EDUCATIONAL CONTENT (Top-of-Funnel)
 
 if __name__ == "__main__":
     orchestrator = SEOOrchestrator()
-    strategy = orchestrator.execute_keyword_strategy()
-    report = orchestrator.generate_seo_report()
+    now = datetime.now()
+    strategy = orchestrator.execute_keyword_strategy(now)
     
-    # Save report to file
-    with open("seo_strategy_report.md", "w", encoding="utf-8") as f:
-        f.write(report)
+    # Stream report to file
+    with open("seo_strategy_report.md", "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(orchestrator.iter_seo_report_chunks(now))
     
     print("SEO Strategy Report generated: seo_strategy_report.md")
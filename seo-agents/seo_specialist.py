@@ -11,13 +11,21 @@ This agent is delegated tasks by the SEO Orchestrator and specializes in:
 - SERP analysis
 """
 
+import asyncio
+import functools
 import json
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Awaitable, Callable, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class KeywordData:
     """Represents keyword research data."""
     keyword: str
@@ -27,17 +35,16 @@ class KeywordData:
     recommended_page: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TitleTagRecommendation:
     """Represents an optimized title tag recommendation."""
     page_url: str
     current_title: Optional[str]
     recommended_title: str
     primary_keyword: str
-    character_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TechnicalSEOIssue:
     """Represents a technical SEO issue found during audit."""
     issue_type: str
@@ -47,6 +54,317 @@ class TechnicalSEOIssue:
     recommendation: str
 
 
+# =========================================================================
+# STATIC SEO DATA
+# =========================================================================
+# Built once at import, along with the handler responses derived from
+# them. Handlers return responses by reference; treat as read-only.
+
+# Researched keywords for the E-Rate consulting niche, as rows in KeywordData
+# field order: (keyword, search_intent, estimated_volume, competition,
+# recommended_page)
+_KEYWORDS_RAW: Tuple[Tuple[str, str, str, str, str], ...] = (
+    # Application Help Keywords (High Intent)
+    ("SkyRate services for schools", "transactional", "medium", "medium", "/"),
+    ("e-rate application assistance", "transactional", "medium", "low", "/e-rate-application-help"),
+    ("e-rate form 470 help", "transactional", "low", "low", "/form-470"),
+    ("e-rate form 471 filing service", "transactional", "medium", "low", "/form-471"),
+    
+    # Problem-Aware Keywords (Position 8-20 targets)
+    ("e-rate application denied what to do", "commercial", "low", "low", "/appeals"),
+    ("e-rate appeal help", "transactional", "low", "low", "/appeals"),
+    ("how to win e-rate appeal", "informational", "low", "low", "/blog/how-to-win-e-rate-appeal"),
+    
+    # Audience-Specific Keywords
+    ("e-rate for charter schools", "commercial", "low", "low", "/charter-schools"),
+    ("e-rate consultant for private schools", "transactional", "low", "low", "/private-schools"),
+    ("SkyRate for libraries", "transactional", "low", "low", "/library-e-rate"),
+    
+    # Informational Keywords (Top-of-Funnel)
+    ("what is e-rate program", "informational", "high", "medium", "/blog/e-rate-beginners-guide"),
+    ("e-rate eligibility requirements", "informational", "medium", "medium", "/faq"),
+    ("e-rate deadline 2026", "informational", "medium", "low", "/blog/e-rate-deadlines-2026"),
+    ("e-rate discount percentage", "informational", "low", "low", "/faq")
+)
+
+
+_TITLE_RECS: Tuple[TitleTagRecommendation, ...] = (
+    TitleTagRecommendation(
+        page_url="/",
+        current_title="SkyRate | #1 E-Rate Application & Funding Experts",
+        recommended_title="SkyRate Services for Schools | 98% Approval Rate",
+        primary_keyword="SkyRate services for schools"
+    ),
+    TitleTagRecommendation(
+        page_url="/e-rate-application-help",
+        current_title=None,
+        recommended_title="E-Rate Application Assistance | Expert Form Filing Help",
+        primary_keyword="e-rate application assistance"
+    ),
+    TitleTagRecommendation(
+        page_url="/form-470",
+        current_title=None,
+        recommended_title="E-Rate Form 470 Help | Competitive Bidding Experts",
+        primary_keyword="e-rate form 470 help"
+    ),
+    TitleTagRecommendation(
+        page_url="/form-471",
+        current_title=None,
+        recommended_title="Form 471 Filing Service | E-Rate Deadline Support 2026",
+        primary_keyword="e-rate form 471 filing service"
+    ),
+    TitleTagRecommendation(
+        page_url="/appeals",
+        current_title=None,
+        recommended_title="E-Rate Appeal Help | USAC & FCC Funding Recovery",
+        primary_keyword="e-rate appeal help"
+    ),
+    TitleTagRecommendation(
+        page_url="/charter-schools",
+        current_title=None,
+        recommended_title="E-Rate for Charter Schools | Technology Funding Experts",
+        primary_keyword="e-rate for charter schools"
+    ),
+    TitleTagRecommendation(
+        page_url="/private-schools",
+        current_title=None,
+        recommended_title="E-Rate Consultant for Private Schools | Expert Guidance",
+        primary_keyword="e-rate consultant for private schools"
+    ),
+    TitleTagRecommendation(
+        page_url="/library-e-rate",
+        current_title=None,
+        recommended_title="SkyRate for Libraries | Maximize Discounts",
+        primary_keyword="SkyRate for libraries"
+    ),
+    TitleTagRecommendation(
+        page_url="/case-studies",
+        current_title=None,
+        recommended_title="E-Rate Success Stories | Real Schools, Real Funding Wins",
+        primary_keyword="e-rate success stories"
+    ),
+    TitleTagRecommendation(
+        page_url="/faq",
+        current_title=None,
+        recommended_title="E-Rate Eligibility Requirements | FAQ & Answers",
+        primary_keyword="e-rate eligibility requirements"
+    )
+)
+
+# Meta descriptions by page URL
+_DESCRIPTIONS: Dict[str, str] = {
+    "/": "Expert E-Rate consulting with 98% approval rate. We've secured $50M+ for 500+ schools & libraries. Get professional Form 470 & 471 help. Free consultation.",
+    "/e-rate-application-help": "Professional E-Rate application assistance from certified consultants. We handle Form 470, Form 471, and all paperwork. 98% first-time approval rate.",
+    "/form-470": "Expert Form 470 filing assistance for schools and libraries. Proper competitive bidding setup, vendor evaluation, and compliance guidance.",
+    "/form-471": "Meet your Form 471 deadline with expert support. We handle the entire filing process, PIA reviews, and ensure maximum funding approval.",
+    "/appeals": "Denied E-Rate funding? Our appeal specialists have won hundreds of USAC and FCC appeals. We recover funding that others can't.",
+    "/charter-schools": "Specialized E-Rate consulting for charter schools. Navigate eligibility requirements, maximize Category 1 & 2 funding, and avoid common pitfalls.",
+    "/private-schools": "E-Rate consulting for private and religious schools. We verify eligibility, maximize discounts up to 90%, and handle all compliance requirements.",
+    "/library-e-rate": "Expert E-Rate consulting for public and private libraries. Maximize your technology discounts with our 25+ years of library E-Rate experience.",
+    "/case-studies": "Real E-Rate success stories from schools and libraries. See how we've recovered denied funding, maximized approvals, and secured millions.",
+    "/faq": "Get answers to common E-Rate questions. Learn about eligibility, discount rates, deadlines, and what services are covered by the E-Rate program."
+}
+
+# Based on analysis of the actual site
+_AUDIT_ISSUES: Tuple[TechnicalSEOIssue, ...] = (
+    TechnicalSEOIssue(
+        issue_type="sitemap",
+        severity="high",
+        page_url="/sitemap.xml",
+        description="No XML sitemap found at standard location",
+        recommendation="Create and submit XML sitemap to Google Search Console"
+    ),
+    TechnicalSEOIssue(
+        issue_type="robots",
+        severity="medium",
+        page_url="/robots.txt",
+        description="Robots.txt file not found or not optimized",
+        recommendation="Create robots.txt with sitemap reference and crawl directives"
+    ),
+    TechnicalSEOIssue(
+        issue_type="internal_links",
+        severity="high",
+        page_url="/",
+        description="Homepage has limited internal links to service pages",
+        recommendation="Add navigation links to /e-rate-application-help, /appeals, /faq pages"
+    ),
+    TechnicalSEOIssue(
+        issue_type="orphan_pages",
+        severity="medium",
+        page_url="multiple",
+        description="Planned service pages have no internal links pointing to them",
+        recommendation="Implement full internal linking strategy as outlined"
+    ),
+    TechnicalSEOIssue(
+        issue_type="schema",
+        severity="low",
+        page_url="/",
+        description="Good: ProfessionalService and FAQPage schema implemented",
+        recommendation="Add LocalBusiness and Review schema for additional rich results"
+    )
+)
+
+
+# What the audit found already in place
+_POSITIVE_FINDINGS: Tuple[str, ...] = (
+    "Schema.org ProfessionalService markup implemented",
+    "FAQPage schema present",
+    "Mobile-responsive design",
+    "Good Core Web Vitals structure (loading screen, font optimization)"
+)
+
+_SERP_FEATURE_TARGETS: Tuple[str, ...] = (
+    "FAQ rich snippets (via FAQPage schema)",
+    "How-to snippets for process content",
+    "Local pack (if local targeting)"
+)
+
+
+def _keyword_aggregates(rows: Tuple[Tuple[str, ...], ...]) -> Tuple[Dict[str, int], int]:
+    """Intent breakdown and low-competition count in a single pass."""
+    intents: Counter = Counter()
+    low_competition = 0
+    for _, intent, _, competition, _ in rows:
+        intents[intent] += 1
+        if competition == "low":
+            low_competition += 1
+    by_intent = {
+        intent: intents[intent]
+        for intent in ("transactional", "commercial", "informational")
+    }
+    return by_intent, low_competition
+
+
+# Aggregates over the static tables, computed once at import
+_KEYWORDS_BY_INTENT, _LOW_COMP_COUNT = _keyword_aggregates(_KEYWORDS_RAW)
+_SEVERITY_COUNTS: Counter = Counter(i.severity for i in _AUDIT_ISSUES)
+_ALL_UNDER_60 = all(len(r.recommended_title) < 60 for r in _TITLE_RECS)
+_DESC_ITEMS: Tuple[Dict, ...] = tuple(
+    {"url": url, "description": desc, "character_count": len(desc)}
+    for url, desc in _DESCRIPTIONS.items()
+)
+
+
+def _build_keyword_research_response() -> Dict:
+    """keyword_research response."""
+    return {
+        "status": "complete",
+        "total_keywords": len(_KEYWORDS_RAW),
+        "keywords_by_intent": dict(_KEYWORDS_BY_INTENT),
+        "low_competition_count": _LOW_COMP_COUNT,
+        "keyword_data": [
+            {
+                "keyword": keyword,
+                "intent": intent,
+                "volume": volume,
+                "competition": competition,
+                "page": page
+            }
+            for keyword, intent, volume, competition, page in _KEYWORDS_RAW
+        ]
+    }
+
+
+@functools.cache
+def _keyword_views() -> Tuple[KeywordData, ...]:
+    """KeywordData views over _KEYWORDS_RAW, built on first use."""
+    return tuple(KeywordData(*row) for row in _KEYWORDS_RAW)
+
+
+def _build_title_tag_response() -> Dict:
+    """optimize_title_tags response."""
+    recommendations = _TITLE_RECS
+    
+    return {
+        "status": "complete",
+        "total_pages": len(recommendations),
+        "all_under_60_chars": _ALL_UNDER_60,
+        "recommendations": [
+            {
+                "url": r.page_url,
+                "current": r.current_title,
+                "recommended": r.recommended_title,
+                "keyword": r.primary_keyword,
+                "chars": len(r.recommended_title)
+            }
+            for r in recommendations
+        ]
+    }
+
+
+def _build_meta_description_response() -> Dict:
+    """write_meta_descriptions response."""
+    return {
+        "status": "complete",
+        "total_descriptions": len(_DESC_ITEMS),
+        "descriptions": list(_DESC_ITEMS)
+    }
+
+
+def _build_technical_audit_response() -> Dict:
+    """Context-independent part of the technical audit response."""
+    issues = _AUDIT_ISSUES
+    
+    return {
+        "total_issues": len(issues),
+        "critical_issues": _SEVERITY_COUNTS["critical"],
+        "high_issues": _SEVERITY_COUNTS["high"],
+        "issues": [
+            {
+                "type": i.issue_type,
+                "severity": i.severity,
+                "page": i.page_url,
+                "description": i.description,
+                "recommendation": i.recommendation
+            }
+            for i in issues
+        ],
+        "positive_findings": list(_POSITIVE_FINDINGS)
+    }
+
+
+def _build_serp_response() -> Dict:
+    """analyze_serp response."""
+    # Analysis based on E-Rate consulting landscape
+    serp_data = {
+        "SkyRate services for schools": {
+            "serp_features": ["local_pack", "faq_snippet"],
+            "top_competitors": ["e-ratecentral.com", "fundsforlearning.com", "kelloggllc.com"],
+            "opportunity": "Position 8-15 achievable with proper optimization"
+        },
+        "e-rate form 470 help": {
+            "serp_features": ["featured_snippet", "people_also_ask"],
+            "top_competitors": ["usac.org", "e-ratecentral.com"],
+            "opportunity": "Low competition - first page achievable"
+        },
+        "e-rate appeal help": {
+            "serp_features": ["people_also_ask"],
+            "top_competitors": ["usac.org", "fcc.gov"],
+            "opportunity": "Very low competition - position 1-5 possible"
+        },
+        "e-rate for charter schools": {
+            "serp_features": ["none"],
+            "top_competitors": ["usac.org"],
+            "opportunity": "Minimal competition - quick win potential"
+        }
+    }
+    
+    return {
+        "status": "complete",
+        "keywords_analyzed": len(serp_data),
+        "serp_data": serp_data,
+        "recommended_serp_features_to_target": list(_SERP_FEATURE_TARGETS)
+    }
+
+
+# Handler responses, fully assembled at import
+_KEYWORD_RESPONSE = _build_keyword_research_response()
+_TITLE_RESPONSE = _build_title_tag_response()
+_META_RESPONSE = _build_meta_description_response()
+_AUDIT_RESPONSE_STATIC = _build_technical_audit_response()
+_SERP_RESPONSE = _build_serp_response()
+
+
 class SEOSpecialist:
     """
     SEO Specialist sub-agent for technical SEO operations.
@@ -59,10 +377,30 @@ class SEOSpecialist:
     - SERP analysis
     """
     
+    __slots__ = ("industry", "target_domain", "keyword_database", "TASKS", "_serp_cache")
+    
+    # Live SERP entries kept by analyze_serp_live
+    SERP_CACHE_SIZE = 256
+    
+    # Task name -> handler method name, bound into TASKS per instance
+    _TASK_METHODS = {
+        "keyword_research": "perform_keyword_research",
+        "audit": "perform_technical_audit",
+        "optimize_title_tags": "optimize_title_tags",
+        "write_meta_descriptions": "write_meta_descriptions",
+        "analyze_serp": "analyze_serp",
+    }
+    
     def __init__(self):
         self.industry = "SkyRate"
         self.target_domain = "erateapp.com"
         self.keyword_database: List[KeywordData] = []
+        # Task name -> bound handler; also used by the orchestrator's router
+        self.TASKS: Dict[str, Callable[[Dict], Dict]] = {
+            task: getattr(self, name) for task, name in self._TASK_METHODS.items()
+        }
+        # Keyword -> live SERP entry, least recently used first
+        self._serp_cache: "OrderedDict[str, Dict]" = OrderedDict()
         
     def execute_task(self, task: str, context: Dict) -> Dict:
         """
@@ -75,20 +413,24 @@ class SEOSpecialist:
         Returns:
             Dict containing task results
         """
-        task_handlers = {
-            "keyword_research": self.perform_keyword_research,
-            "audit": self.perform_technical_audit,
-            "optimize_title_tags": self.optimize_title_tags,
-            "write_meta_descriptions": self.write_meta_descriptions,
-            "analyze_serp": self.analyze_serp
-        }
-        
-        handler = task_handlers.get(task)
+        handler = self.TASKS.get(task)
         if handler:
             return handler(context)
         else:
             return {"error": f"Unknown task: {task}"}
     
+    def execute_task_json(self, task: str, context: Dict) -> bytes:
+        """
+        Execute a delegated SEO task and return the result as JSON bytes.
+        
+        Uses orjson when installed; the keyword and audit payloads are large
+        enough for the stdlib encoder to show up in orchestrator runs.
+        """
+        result = self.execute_task(task, context)
+        if orjson is not None:
+            return orjson.dumps(result)
+        return json.dumps(result).encode("utf-8")
+    
     # =========================================================================
     # KEYWORD RESEARCH
     # =========================================================================
@@ -102,136 +444,8 @@ class SEOSpecialist:
         - High-intent problem/solution queries
         - Niche audience-specific terms
         """
-        keywords = [
-            # Application Help Keywords (High Intent)
-            KeywordData(
-                keyword="SkyRate services for schools",
-                search_intent="transactional",
-                estimated_volume="medium",
-                competition="medium",
-                recommended_page="/"
-            ),
-            KeywordData(
-                keyword="e-rate application assistance",
-                search_intent="transactional",
-                estimated_volume="medium",
-                competition="low",
-                recommended_page="/e-rate-application-help"
-            ),
-            KeywordData(
-                keyword="e-rate form 470 help",
-                search_intent="transactional",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/form-470"
-            ),
-            KeywordData(
-                keyword="e-rate form 471 filing service",
-                search_intent="transactional",
-                estimated_volume="medium",
-                competition="low",
-                recommended_page="/form-471"
-            ),
-            
-            # Problem-Aware Keywords (Position 8-20 targets)
-            KeywordData(
-                keyword="e-rate application denied what to do",
-                search_intent="commercial",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/appeals"
-            ),
-            KeywordData(
-                keyword="e-rate appeal help",
-                search_intent="transactional",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/appeals"
-            ),
-            KeywordData(
-                keyword="how to win e-rate appeal",
-                search_intent="informational",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/blog/how-to-win-e-rate-appeal"
-            ),
-            
-            # Audience-Specific Keywords
-            KeywordData(
-                keyword="e-rate for charter schools",
-                search_intent="commercial",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/charter-schools"
-            ),
-            KeywordData(
-                keyword="e-rate consultant for private schools",
-                search_intent="transactional",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/private-schools"
-            ),
-            KeywordData(
-                keyword="SkyRate for libraries",
-                search_intent="transactional",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/library-e-rate"
-            ),
-            
-            # Informational Keywords (Top-of-Funnel)
-            KeywordData(
-                keyword="what is e-rate program",
-                search_intent="informational",
-                estimated_volume="high",
-                competition="medium",
-                recommended_page="/blog/e-rate-beginners-guide"
-            ),
-            KeywordData(
-                keyword="e-rate eligibility requirements",
-                search_intent="informational",
-                estimated_volume="medium",
-                competition="medium",
-                recommended_page="/faq"
-            ),
-            KeywordData(
-                keyword="e-rate deadline 2026",
-                search_intent="informational",
-                estimated_volume="medium",
-                competition="low",
-                recommended_page="/blog/e-rate-deadlines-2026"
-            ),
-            KeywordData(
-                keyword="e-rate discount percentage",
-                search_intent="informational",
-                estimated_volume="low",
-                competition="low",
-                recommended_page="/faq"
-            )
-        ]
-        
-        self.keyword_database = keywords
-        
-        return {
-            "status": "complete",
-            "total_keywords": len(keywords),
-            "keywords_by_intent": {
-                "transactional": len([k for k in keywords if k.search_intent == "transactional"]),
-                "commercial": len([k for k in keywords if k.search_intent == "commercial"]),
-                "informational": len([k for k in keywords if k.search_intent == "informational"])
-            },
-            "low_competition_count": len([k for k in keywords if k.competition == "low"]),
-            "keyword_data": [
-                {
-                    "keyword": k.keyword,
-                    "intent": k.search_intent,
-                    "volume": k.estimated_volume,
-                    "competition": k.competition,
-                    "page": k.recommended_page
-                }
-                for k in keywords
-            ]
-        }
+        self.keyword_database = list(_keyword_views())
+        return _KEYWORD_RESPONSE
     
     # =========================================================================
     # TITLE TAG OPTIMIZATION
@@ -247,94 +461,7 @@ class SEOSpecialist:
         - Include brand or differentiator
         - Action-oriented where appropriate
         """
-        recommendations = [
-            TitleTagRecommendation(
-                page_url="/",
-                current_title="SkyRate | #1 E-Rate Application & Funding Experts",
-                recommended_title="SkyRate Services for Schools | 98% Approval Rate",
-                primary_keyword="SkyRate services for schools",
-                character_count=55
-            ),
-            TitleTagRecommendation(
-                page_url="/e-rate-application-help",
-                current_title=None,
-                recommended_title="E-Rate Application Assistance | Expert Form Filing Help",
-                primary_keyword="e-rate application assistance",
-                character_count=56
-            ),
-            TitleTagRecommendation(
-                page_url="/form-470",
-                current_title=None,
-                recommended_title="E-Rate Form 470 Help | Competitive Bidding Experts",
-                primary_keyword="e-rate form 470 help",
-                character_count=50
-            ),
-            TitleTagRecommendation(
-                page_url="/form-471",
-                current_title=None,
-                recommended_title="Form 471 Filing Service | E-Rate Deadline Support 2026",
-                primary_keyword="e-rate form 471 filing service",
-                character_count=54
-            ),
-            TitleTagRecommendation(
-                page_url="/appeals",
-                current_title=None,
-                recommended_title="E-Rate Appeal Help | USAC & FCC Funding Recovery",
-                primary_keyword="e-rate appeal help",
-                character_count=48
-            ),
-            TitleTagRecommendation(
-                page_url="/charter-schools",
-                current_title=None,
-                recommended_title="E-Rate for Charter Schools | Technology Funding Experts",
-                primary_keyword="e-rate for charter schools",
-                character_count=56
-            ),
-            TitleTagRecommendation(
-                page_url="/private-schools",
-                current_title=None,
-                recommended_title="E-Rate Consultant for Private Schools | Expert Guidance",
-                primary_keyword="e-rate consultant for private schools",
-                character_count=55
-            ),
-            TitleTagRecommendation(
-                page_url="/library-e-rate",
-                current_title=None,
-                recommended_title="SkyRate for Libraries | Maximize Discounts",
-                primary_keyword="SkyRate for libraries",
-                character_count=52
-            ),
-            TitleTagRecommendation(
-                page_url="/case-studies",
-                current_title=None,
-                recommended_title="E-Rate Success Stories | Real Schools, Real Funding Wins",
-                primary_keyword="e-rate success stories",
-                character_count=56
-            ),
-            TitleTagRecommendation(
-                page_url="/faq",
-                current_title=None,
-                recommended_title="E-Rate Eligibility Requirements | FAQ & Answers",
-                primary_keyword="e-rate eligibility requirements",
-                character_count=47
-            )
-        ]
-        
-        return {
-            "status": "complete",
-            "total_pages": len(recommendations),
-            "all_under_60_chars": all(r.character_count < 60 for r in recommendations),
-            "recommendations": [
-                {
-                    "url": r.page_url,
-                    "current": r.current_title,
-                    "recommended": r.recommended_title,
-                    "keyword": r.primary_keyword,
-                    "chars": r.character_count
-                }
-                for r in recommendations
-            ]
-        }
+        return _TITLE_RESPONSE
     
     # =========================================================================
     # META DESCRIPTION WRITING
@@ -350,31 +477,7 @@ class SEOSpecialist:
         - Include call-to-action
         - Highlight unique value proposition
         """
-        descriptions = {
-            "/": "Expert E-Rate consulting with 98% approval rate. We've secured $50M+ for 500+ schools & libraries. Get professional Form 470 & 471 help. Free consultation.",
-            "/e-rate-application-help": "Professional E-Rate application assistance from certified consultants. We handle Form 470, Form 471, and all paperwork. 98% first-time approval rate.",
-            "/form-470": "Expert Form 470 filing assistance for schools and libraries. Proper competitive bidding setup, vendor evaluation, and compliance guidance.",
-            "/form-471": "Meet your Form 471 deadline with expert support. We handle the entire filing process, PIA reviews, and ensure maximum funding approval.",
-            "/appeals": "Denied E-Rate funding? Our appeal specialists have won hundreds of USAC and FCC appeals. We recover funding that others can't.",
-            "/charter-schools": "Specialized E-Rate consulting for charter schools. Navigate eligibility requirements, maximize Category 1 & 2 funding, and avoid common pitfalls.",
-            "/private-schools": "E-Rate consulting for private and religious schools. We verify eligibility, maximize discounts up to 90%, and handle all compliance requirements.",
-            "/library-e-rate": "Expert E-Rate consulting for public and private libraries. Maximize your technology discounts with our 25+ years of library E-Rate experience.",
-            "/case-studies": "Real E-Rate success stories from schools and libraries. See how we've recovered denied funding, maximized approvals, and secured millions.",
-            "/faq": "Get answers to common E-Rate questions. Learn about eligibility, discount rates, deadlines, and what services are covered by the E-Rate program."
-        }
-        
-        return {
-            "status": "complete",
-            "total_descriptions": len(descriptions),
-            "descriptions": [
-                {
-                    "url": url,
-                    "description": desc,
-                    "character_count": len(desc)
-                }
-                for url, desc in descriptions.items()
-            ]
-        }
+        return _META_RESPONSE
     
     # =========================================================================
     # TECHNICAL SEO AUDIT
@@ -392,68 +495,12 @@ class SEOSpecialist:
         - Canonical URLs
         - Sitemap
         """
-        # Based on analysis of the actual site
-        issues = [
-            TechnicalSEOIssue(
-                issue_type="sitemap",
-                severity="high",
-                page_url="/sitemap.xml",
-                description="No XML sitemap found at standard location",
-                recommendation="Create and submit XML sitemap to Google Search Console"
-            ),
-            TechnicalSEOIssue(
-                issue_type="robots",
-                severity="medium",
-                page_url="/robots.txt",
-                description="Robots.txt file not found or not optimized",
-                recommendation="Create robots.txt with sitemap reference and crawl directives"
-            ),
-            TechnicalSEOIssue(
-                issue_type="internal_links",
-                severity="high",
-                page_url="/",
-                description="Homepage has limited internal links to service pages",
-                recommendation="Add navigation links to /e-rate-application-help, /appeals, /faq pages"
-            ),
-            TechnicalSEOIssue(
-                issue_type="orphan_pages",
-                severity="medium",
-                page_url="multiple",
-                description="Planned service pages have no internal links pointing to them",
-                recommendation="Implement full internal linking strategy as outlined"
-            ),
-            TechnicalSEOIssue(
-                issue_type="schema",
-                severity="low",
-                page_url="/",
-                description="Good: ProfessionalService and FAQPage schema implemented",
-                recommendation="Add LocalBusiness and Review schema for additional rich results"
-            )
-        ]
-        
+        # Everything but the audit date and domain is assembled at import
         return {
             "status": "complete",
             "audit_date": datetime.now().isoformat(),
             "domain": context.get("domain", "erateapp.com"),
-            "total_issues": len(issues),
-            "critical_issues": len([i for i in issues if i.severity == "critical"]),
-            "high_issues": len([i for i in issues if i.severity == "high"]),
-            "issues": [
-                {
-                    "type": i.issue_type,
-                    "severity": i.severity,
-                    "page": i.page_url,
-                    "description": i.description,
-                    "recommendation": i.recommendation
-                }
-                for i in issues
-            ],
-            "positive_findings": [
-                "Schema.org ProfessionalService markup implemented",
-                "FAQPage schema present",
-                "Mobile-responsive design",
-                "Good Core Web Vitals structure (loading screen, font optimization)"
-            ]
+            **_AUDIT_RESPONSE_STATIC
         }
     
     # =========================================================================
@@ -469,39 +516,38 @@ class SEOSpecialist:
         - Competitor presence
         - SERP feature opportunities
         """
-        # Analysis based on E-Rate consulting landscape
-        serp_data = {
-            "SkyRate services for schools": {
-                "serp_features": ["local_pack", "faq_snippet"],
-                "top_competitors": ["e-ratecentral.com", "fundsforlearning.com", "kelloggllc.com"],
-                "opportunity": "Position 8-15 achievable with proper optimization"
-            },
-            "e-rate form 470 help": {
-                "serp_features": ["featured_snippet", "people_also_ask"],
-                "top_competitors": ["usac.org", "e-ratecentral.com"],
-                "opportunity": "Low competition - first page achievable"
-            },
-            "e-rate appeal help": {
-                "serp_features": ["people_also_ask"],
-                "top_competitors": ["usac.org", "fcc.gov"],
-                "opportunity": "Very low competition - position 1-5 possible"
-            },
-            "e-rate for charter schools": {
-                "serp_features": ["none"],
-                "top_competitors": ["usac.org"],
-                "opportunity": "Minimal competition - quick win potential"
-            }
-        }
+        return _SERP_RESPONSE
+    
+    async def analyze_serp_live(self, keywords: List[str],
+                                fetch: Callable[[str], Awaitable[Dict]]) -> Dict:
+        """
+        Analyze live search results for the given keywords.
+        
+        Args:
+            keywords: Keywords to look up
+            fetch: Async callable returning the SERP entry for one keyword
+                (e.g. a thin wrapper around a SerpAPI client session)
+        
+        Keywords not seen recently are fetched concurrently; the rest are
+        served from a per-instance LRU cache of SERP_CACHE_SIZE entries.
+        """
+        cache = self._serp_cache
+        missing = [kw for kw in dict.fromkeys(keywords) if kw not in cache]
+        fetched = await asyncio.gather(*(fetch(kw) for kw in missing))
+        cache.update(zip(missing, fetched))
+        
+        serp_data = {}
+        for kw in keywords:
+            serp_data[kw] = cache[kw]
+            cache.move_to_end(kw)
+        while len(cache) > self.SERP_CACHE_SIZE:
+            cache.popitem(last=False)
         
         return {
             "status": "complete",
             "keywords_analyzed": len(serp_data),
             "serp_data": serp_data,
-            "recommended_serp_features_to_target": [
-                "FAQ rich snippets (via FAQPage schema)",
-                "How-to snippets for process content",
-                "Local pack (if local targeting)"
-            ]
+            "recommended_serp_features_to_target": list(_SERP_FEATURE_TARGETS)
         }
 
 